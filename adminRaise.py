@@ -7,7 +7,7 @@ class Administrator:
         """
         #self.lower_process_priority()
         if require_admin and not self.is_admin():
-            self.elevate()
+            self.elevate(hard_exit=True)
 
     def is_admin(self) -> bool:
         try:
@@ -15,7 +15,8 @@ class Administrator:
         except Exception:
             return False
 
-    def elevate(self, w_o_admin=False):
+    def elevate(self, w_o_admin=False, hard_exit=False):
+        """Relaunch elevated via UAC. hard_exit skips interpreter teardown (safe only before app state exists)."""
         params = " ".join(f'"{arg}"' for arg in sys.argv)
         exe = os.path.splitext(sys.executable)[0] + "w.exe"
         hinst = ctypes.windll.shell32.ShellExecuteW(
@@ -31,6 +32,10 @@ class Administrator:
         else:
             if w_o_admin:
                 self.elevate_w_o_admin()
+            elif hard_exit:
+                # The elevated copy owns startup now; don't unwind imports or run atexit handlers
+                sys.stdout.flush()
+                os._exit(0)
             else:
                 sys.exit(0)
 
@@ -147,6 +147,9 @@ class AudioPlayerRoot:
         self._stop_event = Event()
         self._paused = Event()
         self._play_event = Event()
+        self._reader_done = Event()  # Reader hit the end of the file (not stopped)
+        self.track_ended = Event()   # Whole file played out; waiters can react without polling
+        self.playing = Event()       # Callback is outputting samples; cleared on pause and stop
         self._reader_thread = None
         self._volume = 0.1
         self._position_frames = 0
@@ -259,6 +262,8 @@ class AudioPlayerRoot:
                 except Exception as e:
                     ll.debug(f"Seek during startup failed (will try in reader): {e}")
             self._stop_event.clear()
+            self._reader_done.clear()
+            self.track_ended.clear()
             self._underflow_count = 0
             self._callback_errors = 0
             
@@ -370,6 +375,9 @@ class AudioPlayerRoot:
                     ll.error(f"Error processing audio frame: {e}")
                     continue
 
+            if not self._stop_event.is_set():
+                self._reader_done.set()  # Demux exhausted; the callback signals the end once the buffer drains
+
         except Exception as e:
             ll.error(f"Critical error in audio reader: {e}")
 
@@ -390,6 +398,8 @@ class AudioPlayerRoot:
             audio_data = self._buffer.read(frames)
             if audio_data is None:
                 # Not enough data - this will cause underflow but won't crash
+                if self._reader_done.is_set():
+                    self.track_ended.set()
                 return
             
             # Apply effects if needed
@@ -405,6 +415,8 @@ class AudioPlayerRoot:
             outdata[:] = scaled
 
             self._position_frames += frames
+            if not self.playing.is_set():
+                self.playing.set()
             
         except Exception as e:
             self._callback_errors += 1
@@ -444,11 +456,14 @@ class AudioPlayerRoot:
             self._position_frames = 0
             self._paused.clear()
             self._play_event.clear()
+            self.track_ended.clear()
+            self.playing.clear()
         
         gc.collect()
 
     def pause(self):
         self._paused.set()
+        self.playing.clear()
 
     def unpause(self):
         self._paused.clear()
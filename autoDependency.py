@@ -58,10 +58,12 @@ class AutoDependencies:
             "aiohttp": {"module": "aiohttp", "min_version": "3.7.0"},
             "psutil": {"module": "psutil", "min_version": None},
             "waitress": {"module": "waitress", "min_version": None},
+            "orjson": {"module": "orjson", "min_version": None},
         }
         
         self.missing_details = []
         self.failed_installs = []
+        self.still_missing = []  # Installed but failing the final import / version check
         
         # Check if we're in a virtual environment
         self._check_virtual_environment()
@@ -551,7 +553,7 @@ class AutoDependencies:
         """Comprehensive final verification of all dependencies."""
         print("\n🔁 Final dependency verification:")
         
-        still_missing = []
+        self.still_missing = still_missing = []
         importlib.invalidate_caches()
         
         for pkg, pkg_info in self.packages.items():
@@ -2,8 +2,6 @@ import os
 import sys
 import requests
 from urllib.parse import urljoin
-import tkinter as tk
-from tkinter import messagebox
 from datetime import datetime
 import zipfile
 
@@ -46,6 +44,8 @@ class AutoUpdater:
         """
         Displays a warning message box to the user about exceeding the GitHub API rate limit.
         """
+        import tkinter as tk # Only needed on this rare path, keeps Tcl/Tk off the startup path
+        from tkinter import messagebox
         root = tk.Tk()
         root.withdraw()
         messagebox.showwarning("Update Warning", "GitHub rate limit exceeded. You may be running an older version.")
@@ -192,16 +192,18 @@ class AutoUpdater:
             ll.debug(f"⚪ {path} is up-to-date.")
             return False
 
-    def update(self):
+    def update(self, restart=True):
         """
         Checks and updates each .py and .html file in the repo if needed, then restarts.
+        With restart=False the caller decides when to call restart() (see files_updated).
+        Returns True when the check completed, False if the remote file list couldn't be read.
         """
         ll.debug(f"🚀 Starting update check for {self.repo_url}")
         
         all_files = self.list_files()
         if not all_files:
             ll.warn("❌ No Python or HTML files found in the repo!")
-            return
+            return False
 
         ll.debug(f"📋 Found {len(all_files)} files to check")
         
@@ -217,10 +219,16 @@ class AutoUpdater:
             ll.debug(f"♻️ {len(self.files_updated)} files updated:")
             for file in self.files_updated:
                 ll.debug(f"   - {file}")
-            ll.warn("Restarting script...")
-            os.execv(sys.executable, ['python'] + sys.argv)
+            if restart:
+                self.restart()
         else:
             ll.print("✅ All files are current. No restart needed.")
+        return True
+
+    def restart(self):
+        """Replace this process with a fresh run of the (updated) script."""
+        ll.warn("Restarting script...")
+        os.execv(sys.executable, ['python'] + sys.argv)
 
 
 if __name__ == "__main__":
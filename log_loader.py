@@ -32,11 +32,11 @@ class OutputRedirector:
         # Ensure the log file directory exists
         os.makedirs(os.path.dirname(os.path.abspath(self.filename)), exist_ok=True)
         
-        # Clear the log file on startup to avoid appending to old data
+        # Open (and truncate) the log file once; the flush thread keeps this handle
         try:
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                f.write('')
+            self.file = open(self.filename, 'w', encoding='utf-8', buffering=8192)
         except Exception as e:
+            self.file = None
             sys.__stderr__.write(f"Warning: Could not clear log file on startup: {e}\n")
         
         # The main buffer for incoming writes
@@ -113,11 +113,10 @@ class OutputRedirector:
         """
         Background thread for writing buffer content to the log file.
         """
-        self.file = None
-        
         try:
-            # Open the file once and keep the handle open
-            self.file = open(self.filename, 'a', encoding='utf-8', buffering=8192)
+            # Reuse the handle opened at startup; only reopen if that failed
+            if self.file is None:
+                self.file = open(self.filename, 'a', encoding='utf-8', buffering=8192)
             
             while not self.shutdown:
                 # Wait for a notification or timeout
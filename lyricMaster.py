@@ -41,12 +41,14 @@ class OptimizedJSONHandler:
     
     def __init__(self, filename: str = ".lyricCache.json", 
                  batch_size: int = 50, flush_interval: float = 5.0,
-                 ttl_hours: int = 168):  # 1 week TTL
+                 ttl_hours: int = 168,  # 1 week TTL
+                 negative_ttl_hours: int = 24):  # "No synced lyrics" results are retried after a day
         script_dir = os.path.dirname(os.path.abspath(__file__))
         self.filepath = os.path.join(script_dir, filename)
         self.batch_size = batch_size
         self.flush_interval = flush_interval
         self.ttl_seconds = ttl_hours * 3600
+        self.negative_ttl_seconds = negative_ttl_hours * 3600
         
         # Thread-safe operations
         self._lock = threading.RLock()
@@ -111,7 +113,8 @@ class OptimizedJSONHandler:
             for key, entry_data in raw_cache.items():
                 if isinstance(entry_data, dict) and 'timestamp' in entry_data:
                     # Check TTL
-                    if current_time - entry_data['timestamp'] < self.ttl_seconds:
+                    ttl = self.ttl_seconds if entry_data.get('lyrics') else self.negative_ttl_seconds
+                    if current_time - entry_data['timestamp'] < ttl:
                         lyrics = [LyricEntry(l['timestamp'], l['text']) 
                                 for l in entry_data.get('lyrics', [])]
                         self._cache[key] = CacheEntry(
@@ -125,7 +128,10 @@ class OptimizedJSONHandler:
             self._cache = {}
     
     def get(self, artist: str, title: str) -> Optional[List[LyricEntry]]:
-        """Get cached lyrics with TTL validation."""
+        """
+        Get cached lyrics with TTL validation.
+        Returns None on a miss and an empty list for a song known to have no synced lyrics.
+        """
         key = self._make_key(artist, title)
         
         with self._lock:
@@ -134,14 +140,15 @@ class OptimizedJSONHandler:
                 return None
                 
             # Check TTL
-            if time() - entry.timestamp > self.ttl_seconds:
+            ttl = self.ttl_seconds if entry.lyrics else self.negative_ttl_seconds
+            if time() - entry.timestamp > ttl:
                 del self._cache[key]
                 return None
                 
             return entry.lyrics
     
     def add(self, artist: str, title: str, lyrics: List[LyricEntry]):
-        """Add lyrics to cache with batched writes."""
+        """Add lyrics to cache with batched writes; an empty list records that the song has none."""
         key = self._make_key(artist, title)
         hash_key = self._generate_hash(artist, title)
         
@@ -245,6 +252,11 @@ class OptimizedLyricHandler:
         # Thread pool for concurrent requests
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
         
+        # Prefetching runs on its own single worker so it never queues ahead of a song that is playing now
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        self._prefetching = set()
+        self._prefetch_lock = threading.Lock()
+        
         # Session for connection reuse
         self._session = None
         self._session_lock = threading.Lock()
@@ -330,16 +342,45 @@ class OptimizedLyricHandler:
             except Exception as callback_error:
                 ll.error(f"Callback error after queue failure: {callback_error}")
     
+    def prefetch(self, songs: List[Tuple[str, str]]):
+        """Warm the cache for (artist, title) pairs expected to play soon; pairs already cached or in flight are skipped."""
+        for artist, title in songs:
+            key = self.cache._make_key(artist, title)
+            with self._prefetch_lock:
+                if key in self._prefetching or self.cache.get(artist, title) is not None:
+                    continue
+                self._prefetching.add(key)
+            try:
+                self._prefetch_executor.submit(self._prefetch_one, artist, title, key)
+            except RuntimeError:  # Executor shut down
+                with self._prefetch_lock:
+                    self._prefetching.discard(key)
+                return
+    
+    def _prefetch_one(self, artist: str, title: str, key: str):
+        """Fetch and cache lyrics for one upcoming song; no callback, failures are only logged."""
+        try:
+            if self._shutdown.is_set() or self.cache.get(artist, title) is not None:
+                return
+            lyrics = self._load_synced_lyrics_sync(artist, title)
+            if lyrics is not None:
+                self.cache.add(artist, title, [LyricEntry(ts, text) for ts, text in lyrics])
+        except Exception as e:
+            ll.debug(f"Prefetch failed for {artist} - {title}: {e}")
+        finally:
+            with self._prefetch_lock:
+                self._prefetching.discard(key)
+    
     def request_sync(self, artist: str, title: str) -> List[Tuple[float, str]]:
         """Synchronous request that returns lyrics directly."""
         # Check cache first
         cached = self.cache.get(artist, title)
-        if cached:
+        if cached is not None:
             return [(l.timestamp, l.text) for l in cached]
         
         # Fetch from API with retry logic
         lyrics = self._load_synced_lyrics_sync(artist, title)
-        if lyrics:
+        if lyrics is not None:
             # Cache the results
             lyric_entries = [LyricEntry(ts, text) for ts, text in lyrics]
             self.cache.add(artist, title, lyric_entries)
@@ -355,7 +396,7 @@ class OptimizedLyricHandler:
         cache_misses = []
         for artist, title in requests:
             cached = self.cache.get(artist, title)
-            if cached:
+            if cached is not None:
                 results[(artist, title)] = [(l.timestamp, l.text) for l in cached]
             else:
                 cache_misses.append((artist, title))
@@ -371,7 +412,7 @@ class OptimizedLyricHandler:
             for future, artist, title in futures:
                 try:
                     lyrics = future.result(timeout=self.request_timeout + 5)
-                    if lyrics:
+                    if lyrics is not None:
                         lyric_entries = [LyricEntry(ts, text) for ts, text in lyrics]
                         self.cache.add(artist, title, lyric_entries)
                         results[(artist, title)] = lyrics
@@ -398,7 +439,7 @@ class OptimizedLyricHandler:
         for artist, title, callback, song_id in batch:
             try:
                 cached = self.cache.get(artist, title)
-                if cached:
+                if cached is not None:
                     cache_hits.append((cached, callback, song_id))
                 else:
                     api_requests.append((artist, title, callback, song_id))
@@ -465,8 +506,8 @@ class OptimizedLyricHandler:
         try:
             lyrics = self._load_synced_lyrics_sync(artist, title)
             
-            if lyrics:
-                # Cache the results
+            if lyrics is not None:
+                # Cache the results (an empty list remembers that this song has none)
                 lyric_entries = [LyricEntry(ts, text) for ts, text in lyrics]
                 self.cache.add(artist, title, lyric_entries)
                 Thread(target=lambda:callback(lyrics, song_id)).start()
@@ -481,7 +522,10 @@ class OptimizedLyricHandler:
                 ll.error(f"Callback error after fetch failure: {callback_error}")
     
     def _load_synced_lyrics_sync(self, artist: str, title: str, max_retries: int = 2) -> Optional[List[Tuple[float, str]]]:
-        """Synchronous lyrics fetching with rate limiting and retry logic."""
+        """
+        Synchronous lyrics fetching with rate limiting and retry logic.
+        Returns [] when the song has no synced lyrics and None when the lookup itself failed.
+        """
         # Clean titles
         artist_clean, title_clean = self._clean_title_for_lyrics(artist, title)
         
@@ -509,7 +553,7 @@ class OptimizedLyricHandler:
                 response = session.get(url, timeout=timeout)
                 
                 if response.status_code == 404:
-                    return None
+                    return []
                 elif response.status_code == 429:  # Rate limited
                     if attempt < max_retries:
                         wait_time = 2 ** attempt  # Exponential backoff
@@ -526,7 +570,7 @@ class OptimizedLyricHandler:
                 synced_lyrics = data.get("syncedLyrics", "")
                 if synced_lyrics:
                     return self._parse_lyrics_timestamps(synced_lyrics.splitlines())
-                return None
+                return []
                 
             except requests.exceptions.Timeout as e:
                 last_error = e
@@ -619,6 +663,9 @@ class OptimizedLyricHandler:
             except Exception as e:
                 ll.error(f"Error closing session: {e}")
         
+        # Drop queued prefetches; they are only a cache warm-up
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        
         # Shutdown executor with timeout
         try:
             self._executor.shutdown(wait=True, timeout=10)
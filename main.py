@@ -1,53 +1,162 @@
-import os
-
-DevMode = os.path.exists(".developer_options.json") # Enable developer mode
-FastLoad = os.path.exists(".fast_load.json") # Enable fast load mode
-
-try:
-    from adminRaise import Administrator
-    from autoDependency import AutoDependencies
-    from autoUpdate import AutoUpdater
-    from log_loader import log_loader, OutputRedirector
-except:
-    from .adminRaise import Administrator
-    from .autoDependency import AutoDependencies
-    from .autoUpdate import AutoUpdater
-    from .log_loader import log_loader, OutputRedirector
+import os, sys, gc, importlib, time, hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+DevMode = os.path.isfile(".developer_options.json") # Enable developer mode
+FastLoad = os.path.isfile(".fast_load.json") # Enable fast load mode
+ParallelBootstrap = "--no-parallel-bootstrap" not in sys.argv # Overlap install stages unless debugging
+UpdateCheckInterval = 60 * 60 # Seconds between remote update checks
+BootstrapOrder = tuple(stage.strip() for stage in os.environ.get("MUSICAPP_BOOTSTRAP_ORDER", "update,admin,deps").split(",") if stage.strip())
+
+# Resolve sibling modules once: flat script run vs. imported as part of a package
+_module_prefix = f"{__package__}." if __package__ else ""
+
+def _import_names(module_name: str, *names: str):
+    """Import a sibling module by name and return the requested attributes in order."""
+    module = importlib.import_module(f"{_module_prefix}{module_name}")
+    return tuple(getattr(module, name) for name in names)
+
+log_loader, OutputRedirector = _import_names("log_loader", "log_loader", "OutputRedirector")
 
 ### Install Handler ###
 
-if not DevMode and not FastLoad:
-    AutoUpdater("https://github.com/The-Autonomous/MusicApp", branch="main").update()
-    Administrator()
-    AutoDependencies().install()
+def _stamp_path(name: str) -> str:
+    """Location of a bootstrap stamp file under %LOCALAPPDATA%/MusicApp (home directory elsewhere)."""
+    stamp_dir = os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "MusicApp")
+    os.makedirs(stamp_dir, exist_ok=True)
+    return os.path.join(stamp_dir, name)
+
+def _run_update(AutoUpdater):
+    """
+    Run the updater unless a check already completed within UpdateCheckInterval.
+    Never restarts by itself: returns the updater when files changed so the main thread can restart() once bootstrap is idle.
+    """
+    sentinel = _stamp_path(".last_update_check")
+    try:
+        if os.stat(sentinel).st_mtime > time.time() - UpdateCheckInterval:
+            return None
+    except OSError:
+        pass # No previous check recorded
+    updater = AutoUpdater("https://github.com/The-Autonomous/MusicApp", branch="main")
+    if updater.update(restart=False):
+        with open(sentinel, "a"):
+            os.utime(sentinel, None)
+    return updater if updater.files_updated else None
+
+def _deps_manifest_hash() -> str:
+    """Hash of the dependency manifest (autoDependency.py) plus the interpreter it was checked against."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "autoDependency.py"), "rb") as f:
+        digest.update(f.read())
+    digest.update(f"{sys.executable}|{sys.version}".encode("utf-8"))
+    return digest.hexdigest()
+
+def _run_deps(AutoDependencies):
+    """
+    Check/install dependencies only when the manifest or interpreter changed since the last clean run.
+    A run is clean when nothing failed to install and nothing failed the final import / version check.
+    """
+    stamp = _stamp_path(".deps_stamp")
+    try:
+        manifest_hash = _deps_manifest_hash()
+    except OSError:
+        manifest_hash = None
+    if manifest_hash:
+        try:
+            with open(stamp, "r", encoding="utf-8") as f:
+                if f.read().strip() == manifest_hash:
+                    return
+        except OSError:
+            pass # No clean run recorded yet
+    installer = AutoDependencies()
+    installer.install()
+    if manifest_hash and not installer.failed_installs and not installer.still_missing:
+        with open(stamp, "w", encoding="utf-8") as f:
+            f.write(manifest_hash)
 
-### Logging Handler ###
+def bootstrap(stages=("update", "admin", "deps"), parallel: bool = True):
+    """
+    Run the install stages ("update", "admin", "deps") named in `stages`.
+    Serial mode runs them in the given order. Parallel mode overlaps the updater with dependency install.
+    Elevation stays on the main thread and waits for the updater first, because a successful UAC relaunch
+    exits this process on the spot; dependency install only starts once elevation is settled.
+    A restart after an update also happens on the main thread, once no other stage is running.
+    Install modules are imported here so dev / fast-load runs never load requests, psutil or tqdm.
+    """
+    Administrator, = _import_names("adminRaise", "Administrator")
+    AutoDependencies, = _import_names("autoDependency", "AutoDependencies")
+    AutoUpdater, = _import_names("autoUpdate", "AutoUpdater")
 
-ll = log_loader("Main", debugging = False)
-ll.debug(f"Executing With Developer Mode: {DevMode}")
+    runners = {
+        "update": lambda: _run_update(AutoUpdater),
+        "admin": lambda: Administrator(),
+        "deps": lambda: _run_deps(AutoDependencies),
+    }
+    unknown = [stage for stage in stages if stage not in runners]
+    if unknown:
+        raise ValueError(f"Unknown bootstrap stage(s): {', '.join(unknown)}")
 
-#######################
+    if not parallel:
+        for stage in stages:
+            updater = runners[stage]()
+            if stage == "update" and updater:
+                updater.restart()
+        return
 
-import tkinter as tk
+    updater = None
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="bootstrap") as pool:
+        update_future = pool.submit(runners["update"]) if "update" in stages else None
+        futures = []
+        if "admin" in stages and not Administrator(require_admin=False).is_admin():
+            # Finish writing updated files before UAC can hard-exit this process
+            if update_future:
+                updater, update_future = update_future.result(), None
+                if updater:
+                    updater.restart() # The restarted copy asks for elevation with the new code
+            runners["admin"]() # Blocks until UAC resolves; exits if the elevated copy took over
+        if update_future:
+            futures.append(update_future)
+        if "deps" in stages:
+            futures.append(pool.submit(runners["deps"]))
+        for future in as_completed(futures):
+            result = future.result() # Surface stage errors (and SystemExit) on the main thread
+            if future is update_future:
+                updater = result
+    if updater:
+        updater.restart() # Every stage has finished; nothing is left mid-write or mid-install
 
-try:
-    from ghost import GhostOverlay
-    from playerUtils import MusicOverlayController, ProgramShutdown
-except ImportError:
-    from .ghost import GhostOverlay
-    from .playerUtils import MusicOverlayController, ProgramShutdown
+if not DevMode and not FastLoad:
+    bootstrap(stages=BootstrapOrder, parallel=ParallelBootstrap)
 
 def main():
+    # GUI modules load here so the updater restart / UAC relaunch paths never pay for Tcl/Tk
+    import tkinter as tk
+    GhostOverlay, = _import_names("ghost", "GhostOverlay")
+    MusicOverlayController, ProgramShutdown = _import_names("playerUtils", "MusicOverlayController", "ProgramShutdown")
+
     root = tk.Tk()
-    root.withdraw()
     
-    # Create and register shutdown handler #
+    # Create and register shutdown handler before any controller threads exist #
     shutdown_handler = ProgramShutdown()
     shutdown_handler.register_root(root)
+    root.protocol("WM_DELETE_WINDOW", lambda: shutdown_handler.shutdown(reason="Main window closed"))
+    root.withdraw()
     
-    MusicOverlayController(GhostOverlay(root), fast_load=FastLoad)
+    # Paint the overlay before the player spends time scanning / downloading
+    overlay = GhostOverlay(root)
+    overlay.set_text("Initializing...")
+    root.update_idletasks()
+    
+    MusicOverlayController(overlay, fast_load=FastLoad)
+    
+    # Everything built so far lives for the whole session; keep it out of future GC scans
+    gc.freeze()
+
     root.mainloop()
 
 if __name__ == '__main__':
+    ### Logging Handler (script runs only; importing main must not start logging) ###
+    ll = log_loader("Main", debugging = False)
+
     with OutputRedirector(enable_dual_logging = DevMode) as log_redirector:
-        main()
\ No newline at end of file
+        ll.debug(f"Executing With Developer Mode: {DevMode}")
+        main()
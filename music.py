@@ -1,11 +1,19 @@
-import os, random, ast, requests, json, multiprocessing, ctypes, re, random
-from functools import lru_cache
-from collections import deque
-from multiprocessing import Array as MPArray
-from threading import Event, Thread, Lock
+import os, stat, random, ast, heapq, requests, orjson, pickle, sqlite3, atexit, multiprocessing, re, random
+from itertools import count, islice
+from array import array
+from collections import deque, Counter, OrderedDict, defaultdict
+from threading import Event, Thread, Lock, RLock, Condition
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from mutagen import File
+from mutagen.mp3 import EasyMP3
+from mutagen.flac import FLAC
+from mutagen.oggvorbis import OggVorbis
+import numpy as np
 from pathlib import Path
-from time import time, sleep
+from time import time, sleep, monotonic
 
 ### IMPORTS ###
 
@@ -34,7 +42,18 @@ ll = log_loader("Music Player")
 
 #####################################################################################################
 
-save_playback_lock = Lock()  # Lock for saving playback state
+# Keep-alive session for radio lyric downloads; transient 5xx / connection errors retry with backoff
+_RADIO_LYRIC_SESSION = requests.Session()
+_RADIO_LYRIC_ADAPTER = HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504), allowed_methods=frozenset({"GET"})))
+_RADIO_LYRIC_SESSION.mount("http://", _RADIO_LYRIC_ADAPTER)
+_RADIO_LYRIC_SESSION.mount("https://", _RADIO_LYRIC_ADAPTER)
+_RADIO_LYRIC_ATTEMPTS = 3  # Polls for the host to have lyrics ready (empty body) before giving up
+_RADIO_LYRIC_MIN_BYTES = 12  # Anything this short is an empty lyric list, not real lyrics
+
+#####################################################################################################
+
+save_playback_lock = Lock()  # Guards the pending playback-state snapshot (held for a reference swap only)
+state_writer_lock = Lock()   # Serialises state-file writes (background writer vs. exit flush)
 
 #####################################################################################################
 
@@ -42,86 +61,310 @@ _REPARSE      = 0x0400   # OneDrive stub (older)
 _OFFLINE      = 0x1000   # “offline” file
 _RECALL_OPEN  = 0x04000  # new OneDrive smart-file flag
 _PLACEHOLDER_MASK = _REPARSE | _OFFLINE | _RECALL_OPEN
+_CLOUD_ROOT_VARS = ("OneDrive", "OneDriveConsumer", "OneDriveCommercial")  # Env vars naming synced folders
+_PLACEHOLDER_PROBE = 16  # Files sampled per library root before trusting it holds no placeholders
 
 #####################################################################################################
 
 _SKIP_TIME_LENGTH_MAX = 15 * 60     # Skip 15 Minutes
 _SKIP_TIME_LENGTH_MIN = 15          # Skip 15 Seconds
 _RESTART_THRESHOLD_SECONDS = 3      # If song isnt within 3 seconds of the start restart instead of skipping
+_METADATA_WORKERS = 8               # Parallel tag readers for cache misses during library scan
+_DOWNLOAD_WORKERS = min(8, (os.cpu_count() or 1) * 2)  # Playlist URLs downloaded at once during startup
+_RADIO_DISPLAY_TIMEOUT = 1          # Longest the radio display waits for a client update before rechecking mode / station (Seconds)
+_LYRIC_RECHECK_INTERVAL = 1         # Lyric waits re-test their condition at least this often (Seconds)
+_LYRIC_PREFETCH_COUNT = 3           # Upcoming songs whose lyrics are fetched ahead of time
+_TASK_WORKERS = 2                   # Pooled threads for short per-song jobs (lyric lookups)
+_META_FLUSH_EVERY = 500             # Write metadata rows to disk every N parsed files
+_STATE_SAVE_DEBOUNCE = 0.5          # Coalesce playback-state saves into one write per this many seconds
+_YT_SEARCH_CACHE_SIZE = 64          # Most recent YouTube searches kept in memory
+_YT_SEARCH_CACHE_TTL = 10 * 60      # Drop cached YouTube results after 10 Minutes
+_SEARCH_CACHE_SIZE = 32             # Most recent local library searches kept in memory
+_MIXER_READY_TIMEOUT = 5            # Stop waiting for playback to begin after 5 Seconds
+_SHUFFLE_JITTER = 0.1               # Per-song dither (in slots) when spreading an artist across a shuffle round
+
+#####################################################################################################
+
+_TOKEN_SPLIT = re.compile(r'[\s.,_-]+')     # Splits a search query into keywords
+_PUNCT_STRIP = re.compile(r'[^\w\s]')       # Removes punctuation so "s.t.a.y" matches "stay"
+_STOP_WORDS = frozenset({'by', 'the', 'a', 'an', 'in', 'on', 'ft', 'feat', 'and', '&'})
 
 #####################################################################################################
 
-class SharedString:
+def _search_key(artist: str, title: str) -> str:
     """
-    A thread-safe, process-safe shared string implementation using multiprocessing.Array
-    This is the most efficient way to share strings between processes.
+    Lowercased "artist title" with punctuation removed, used for search matching.
+    This turns "Hans Zimmer - S.T.A.Y." into "hans zimmer stay".
     """
-    
-    def __init__(self, initial_value="", max_size=256):
-        """
-        Initialize a shared string.
-        
-        Args:
-            initial_value: Starting string value
-            max_size: Maximum bytes the string can hold (default 256)
-        """
-        self.max_size = max_size
-        self._array = MPArray(ctypes.c_char, max_size)
-        self._lock = multiprocessing.Lock()
-        
-        # Set initial value
-        if initial_value:
-            self.set(initial_value)
+    return _PUNCT_STRIP.sub('', f"{artist} {title}".lower())
+
+def _trigrams(text: str) -> set:
+    """Distinct 3-character substrings of text, the keys of the library search index."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+#####################################################################################################
+
+_ID3_TEXT_ENCODINGS = ('latin-1', 'utf-16', 'utf-16-be', 'utf-8')  # ID3v2 text encoding byte -> codec
+_ID3_WANTED = {b'TIT2': 'title', b'TPE1': 'artist', b'TLEN': 'length'}
+_MPEG_SAMPLERATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}  # By version bits
+_MP3_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)  # Layer III, kbit/s
+_MP3_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)      # Layer III, MPEG 2 / 2.5
+_MPEG_SYNC_SCAN = 4096  # Bytes searched after the tag for the first frame header
+_FLAC_STREAMINFO, _FLAC_VORBIS_COMMENT = 0, 4  # FLAC metadata block types the probe reads; the rest are skipped
+_FLAC_WANTED = {'title', 'artist'}
+_MUTAGEN_BY_EXT = {'.mp3': EasyMP3, '.flac': FLAC, '.ogg': OggVorbis}  # Skip File()'s probe-every-format sniffing
+
+def _syncsafe(data: bytes) -> int:
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+def _fast_id3_probe(path: str):
+    """
+    Read artist / title / duration from an MP3 with a plain ID3v2.3 / v2.4 tag without mutagen.
+    Duration comes from TLEN, else a Xing / Info frame count, else a CBR estimate from the first frame.
+    Returns None for anything unusual (no tag, v2.2, unsynchronised or compressed frames, no Layer III
+    frame) so the caller can fall back to a full parse.
+    """
+    with open(path, 'rb') as f:
+        header = f.read(10)
+        if len(header) < 10 or header[:3] != b'ID3' or header[3] not in (3, 4):
+            return None
+        version, flags = header[3], header[5]
+        if flags & 0x80:
+            return None  # Whole-tag unsynchronisation
+        tag_size = _syncsafe(header[6:10])
+        tag = f.read(tag_size)
+        audio_start = 10 + tag_size + (10 if flags & 0x10 else 0)  # v2.4 footer
+        f.seek(audio_start)
+        audio_head = f.read(_MPEG_SYNC_SCAN)
+        file_size = os.fstat(f.fileno()).st_size
+
+    # Text frames
+    found = {}
+    pos = 0
+    if flags & 0x40:  # Extended header: v2.3 size excludes itself, v2.4 (syncsafe) includes it
+        pos = _syncsafe(tag[:4]) if version == 4 else int.from_bytes(tag[:4], 'big') + 4
+    while pos + 10 <= len(tag) and len(found) < len(_ID3_WANTED):
+        frame_id = tag[pos:pos + 4]
+        if frame_id[0] == 0:
+            break  # Padding
+        size = _syncsafe(tag[pos + 4:pos + 8]) if version == 4 else int.from_bytes(tag[pos + 4:pos + 8], 'big')
+        body = tag[pos + 10:pos + 10 + size]
+        pos += 10 + size
+        key = _ID3_WANTED.get(frame_id)
+        if key is None:
+            continue
+        if tag[pos - size - 1] or not body or body[0] > 3:
+            return None  # Compressed / encrypted / unsynchronised frame, or unknown encoding
+        text = body[1:].decode(_ID3_TEXT_ENCODINGS[body[0]], errors='ignore')
+        found[key] = text.split('\x00', 1)[0].strip()
+
+    duration = int(found['length']) / 1000.0 if found.get('length', '').isdigit() else 0.0
+    if not duration:
+        # First MPEG Layer III frame header
+        for i in range(len(audio_head) - 3):
+            if audio_head[i] != 0xFF or audio_head[i + 1] & 0xE0 != 0xE0:
+                continue
+            b1, b2, b3 = audio_head[i + 1], audio_head[i + 2], audio_head[i + 3]
+            mpeg, layer = (b1 >> 3) & 0x3, (b1 >> 1) & 0x3
+            bitrate_index, rate_index = b2 >> 4, (b2 >> 2) & 0x3
+            if mpeg == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+                continue
+            samplerate = _MPEG_SAMPLERATES[mpeg][rate_index]
+            mono = (b3 >> 6) == 3
+            side_info = (17 if mono else 32) if mpeg == 3 else (9 if mono else 17)
+            xing = audio_head[i + 4 + side_info:i + 4 + side_info + 12]
+            if xing[:4] in (b'Xing', b'Info') and int.from_bytes(xing[4:8], 'big') & 0x1:
+                frames = int.from_bytes(xing[8:12], 'big')
+                duration = frames * (1152 if mpeg == 3 else 576) / samplerate
+            else:
+                bitrate = (_MP3_BITRATES_V1 if mpeg == 3 else _MP3_BITRATES_V2)[bitrate_index] * 1000
+                duration = (file_size - audio_start - i) * 8 / bitrate
+            break
         else:
-            # Initialize with null bytes
-            for i in range(max_size):
-                self._array[i] = b'\x00'
-    
-    def set(self, value: str) -> None:
-        """
-        Set the shared string value.
-        Thread-safe and process-safe.
-        """
-        with self._lock:
-            # Encode string to bytes, truncate if needed
-            encoded = value.encode('utf-8', errors='ignore')
-            if len(encoded) >= self.max_size:
-                encoded = encoded[:self.max_size - 1]
-            
-            # Clear the array first
-            for i in range(self.max_size):
-                self._array[i] = b'\x00'
-            
-            # Write the encoded bytes
-            for i, byte in enumerate(encoded):
-                self._array[i] = bytes([byte])
-            
-            # Ensure null termination
-            self._array[len(encoded)] = b'\x00'
-    
-    def get(self) -> str:
-        """
-        Get the current string value.
-        Thread-safe and process-safe.
-        """
-        with self._lock:
-            # Find the null terminator
-            result_bytes = []
-            for i in range(self.max_size):
-                if self._array[i] == b'\x00':
-                    break
-                result_bytes.append(self._array[i])
-            
-            # Convert bytes to string
-            if result_bytes:
-                return b''.join(result_bytes).decode('utf-8', errors='ignore')
-            return ""
-    
-    def __str__(self):
-        return self.get()
-    
-    def __repr__(self):
-        return f"SharedString(value='{self.get()}', max_size={self.max_size})"
+            return None
+
+    return {
+        'artist': found.get('artist') or 'Unknown Artist',
+        'title': found.get('title') or os.path.splitext(os.path.basename(path))[0],
+        'duration': float(duration),
+    }
+
+def _fast_flac_probe(path: str):
+    """
+    Read artist / title / duration from a FLAC file's STREAMINFO and VORBIS_COMMENT blocks without mutagen.
+    Other metadata blocks (embedded cover art, padding, seek tables) are seeked over rather than read.
+    Returns None for anything unusual (leading ID3 tag, missing STREAMINFO) so the caller can fall back to a full parse.
+    """
+    found = {}
+    duration = None
+    with open(path, 'rb') as f:
+        if f.read(4) != b'fLaC':
+            return None
+        while True:
+            header = f.read(4)
+            if len(header) < 4:
+                break
+            last, block_type = header[0] & 0x80, header[0] & 0x7F
+            size = int.from_bytes(header[1:4], 'big')
+            if block_type == _FLAC_STREAMINFO:
+                info = f.read(size)
+                if len(info) < 18:
+                    return None
+                samplerate = (info[10] << 12) | (info[11] << 4) | (info[12] >> 4)
+                samples = ((info[13] & 0x0F) << 32) | int.from_bytes(info[14:18], 'big')
+                duration = samples / samplerate if samplerate else 0.0
+            elif block_type == _FLAC_VORBIS_COMMENT:
+                block = f.read(size)
+                pos = 4 + int.from_bytes(block[:4], 'little')  # Skip the vendor string
+                count = int.from_bytes(block[pos:pos + 4], 'little')
+                pos += 4
+                for _ in range(count):
+                    length = int.from_bytes(block[pos:pos + 4], 'little')
+                    key, _, value = block[pos + 4:pos + 4 + length].decode('utf-8', errors='ignore').partition('=')
+                    pos += 4 + length
+                    key = key.lower()
+                    if key in _FLAC_WANTED and key not in found:
+                        found[key] = value.strip()
+                break  # Tags are the last thing needed; never read the audio frames
+            else:
+                f.seek(size, os.SEEK_CUR)
+            if last:
+                break
+    if duration is None:
+        return None
+
+    return {
+        'artist': found.get('artist') or 'Unknown Artist',
+        'title': found.get('title') or os.path.splitext(os.path.basename(path))[0],
+        'duration': float(duration),
+    }
+
+_FAST_PROBES = {'.mp3': _fast_id3_probe, '.flac': _fast_flac_probe}  # Header-only tag readers tried before mutagen
+
+#####################################################################################################
+
+class HistoryDeque(deque):
+    """
+    A deque (optionally bounded by maxlen) that also keeps per-item counts,
+    so `item in history` is an O(1) hash lookup instead of a linear scan.
+    Counts are kept in step on every append, eviction and pop.
+    """
+    def __init__(self, iterable=(), maxlen=None):
+        super().__init__(maxlen=maxlen)
+        self._counts = Counter()
+        self.extend(iterable)
+
+    def _remember(self, item):
+        self._counts[item] += 1
+
+    def _forget(self, item):
+        remaining = self._counts[item] - 1
+        if remaining > 0:
+            self._counts[item] = remaining
+        else:
+            del self._counts[item]
+
+    def append(self, item):
+        if self.maxlen is not None:
+            if self.maxlen == 0:
+                return
+            if len(self) == self.maxlen:
+                self._forget(self[0])  # Evicted by the bounded append below
+        super().append(item)
+        self._remember(item)
+
+    def extend(self, iterable):
+        for item in iterable:
+            self.append(item)
+
+    def pop(self):
+        item = super().pop()
+        self._forget(item)
+        return item
+
+    def popleft(self):
+        item = super().popleft()
+        self._forget(item)
+        return item
+
+    def clear(self):
+        super().clear()
+        self._counts.clear()
+
+    def truncate(self, length):
+        """Drop the newest items so at most `length` remain, keeping counts in step."""
+        if length <= 0:
+            self.clear()
+            return
+        while len(self) > length:
+            self.pop()
+
+    def __contains__(self, item):
+        return item in self._counts
+
+class IndexQueue:
+    """
+    A FIFO of song indices kept in a flat array.array('I') (4 bytes per entry instead of a boxed int).
+    popleft advances a read cursor; consumed slots are dropped once they fill half the buffer.
+    """
+    __slots__ = ('_items', '_head')
+
+    def __init__(self, items=None):
+        self._items = items if items is not None else array('I')
+        self._head = 0
+
+    def popleft(self):
+        if self._head >= len(self._items):
+            raise IndexError("pop from an empty IndexQueue")
+        item = self._items[self._head]
+        self._head += 1
+        if self._head >= 1024 and self._head * 2 >= len(self._items):
+            del self._items[:self._head]
+            self._head = 0
+        return item
+
+    def append(self, item):
+        self._items.append(item)
+
+    def __len__(self):
+        return len(self._items) - self._head
+
+    def peek(self, limit):
+        """The next `limit` indices without consuming them."""
+        return self._items[self._head:self._head + limit].tolist()
+
+class PathHistoryDeque(HistoryDeque):
+    """
+    A HistoryDeque of song paths that mirrors membership into a bytearray indexed by cache position.
+    Paths are resolved to indices once when they enter or leave the history,
+    so the shuffler can test a candidate index with a single byte read.
+    """
+    def __init__(self, index_of, maxlen=None):
+        self._index_of = index_of  # Shared path -> cache index map, owned by the shuffler
+        self.recent = bytearray(len(index_of))
+        super().__init__(maxlen=maxlen)
+
+    def grow(self, size):
+        """Extend the bitmap to cover a cache of `size` songs."""
+        if size > len(self.recent):
+            self.recent.extend(bytes(size - len(self.recent)))
+
+    def _remember(self, item):
+        super()._remember(item)
+        index = self._index_of.get(item)
+        if index is not None:
+            self.recent[index] = 1
+
+    def _forget(self, item):
+        super()._forget(item)
+        if item not in self._counts:
+            index = self._index_of.get(item)
+            if index is not None:
+                self.recent[index] = 0
+
+    def clear(self):
+        super().clear()
+        self.recent[:] = bytes(len(self.recent))
 
 #####################################################################################################
 
@@ -131,41 +374,145 @@ class SmartShuffler:
     for large music libraries. It avoids copying the main song cache and uses
     efficient data structures for history and artist tracking.
     """
+    MAX_REJECTS = 64  # Candidates rotated per pick before giving up on history/artist rules
+
     def __init__(self, cache=[], history_size=50, artist_spacing=2):
         self.cache = cache  # Reference to the main cache, no copy
+        # Guards cache positions: appends, the parallel indexes and the history bitmap change together under it.
+        # Reentrant because get_unique_song refills the queue while holding it.
+        self.lock = RLock()
         self.history_size = history_size
         self.artist_spacing = artist_spacing
         
-        # Use deque for efficient history management
-        self.history = deque(maxlen=history_size)
-        self.artist_history = deque(maxlen=artist_spacing)
+        # path -> cache index; a path added twice resolves to its latest position
+        self.index_of = {song['path']: i for i, song in enumerate(self.cache)}
+        
+        # Bounded deques with O(1) membership for history and artist spacing checks;
+        # history also keeps a per-index bitmap so shuffle candidates are checked without hashing paths
+        self.history = PathHistoryDeque(self.index_of, maxlen=history_size)
+        self.artist_history = HistoryDeque(maxlen=artist_spacing)
         
-        self.upcoming_indices = []
-        self.replay_queue = []
+        self.upcoming_indices = IndexQueue()
+        self.replay_queue = deque()  # Songs to play before the shuffle, front first
+        
+        # Search index kept parallel to cache (same positions), built once per song
+        self.search_index = [_search_key(song.get('artist', ''), song.get('title', '')) for song in self.cache]
+        # trigram -> ascending cache positions whose search key contains it; narrows a search to likely matches
+        self.trigram_index = defaultdict(list)
+        for i, key in enumerate(self.search_index):
+            self._index_trigrams(i, key)
+        # path -> song for O(1) lookups when playing / navigating by path
+        self.by_path = {song['path']: song for song in self.cache}
+
+    def add_song(self, song):
+        """
+        Append a song to the cache and keep the search index and path lookup in step.
+        Called from the library scan and from YouTube download workers at once, so the whole update is one locked step.
+        """
+        key = _search_key(song.get('artist', ''), song.get('title', ''))
+        with self.lock:
+            position = len(self.cache)
+            self.cache.append(song)
+            self.search_index.append(key)
+            self._index_trigrams(position, key)
+            self.by_path[song['path']] = song
+            self.history.grow(position + 1)
+            previous = self.index_of.get(song['path'])
+            self.index_of[song['path']] = position
+            if previous is not None and self.history.recent[previous]:
+                # Path re-added while still recent: its history bit moves to the new position
+                self.history.recent[previous] = 0
+                self.history.recent[position] = 1
+
+    def _index_trigrams(self, position, key):
+        for gram in _trigrams(key):
+            self.trigram_index[gram].append(position)
+
+    def search_candidates(self, tokens):
+        """
+        Cache positions (ascending) that could contain every token, from the trigram index.
+        Returns None when no token is long enough to narrow the search, meaning every song is a candidate.
+        Call with self.lock held so the postings don't change mid-intersection.
+        """
+        grams = set()
+        for token in tokens:
+            grams |= _trigrams(token)
+        if not grams:
+            return None
+        postings = sorted((self.trigram_index.get(gram, ()) for gram in grams), key=len)
+        if not postings[0]:
+            return []
+        matches = set(postings[0])
+        for posting in postings[1:]:
+            matches.intersection_update(posting)
+            if not matches:
+                return []
+        return sorted(matches)
 
     def _refill_upcoming(self):
-        """Refills the upcoming queue with shuffled indices, not song objects."""
-        if not self.cache:
-            return
+        """
+        Refills the upcoming queue with shuffled indices, not song objects.
+        Each artist's songs are spread evenly across the round (dithered interleave), so picks rarely trip the artist spacing rule.
+        """
+        with self.lock:
+            if not self.cache:
+                return
+            
+            n = len(self.cache)
+            self.upcoming_indices = IndexQueue(array('I', self._spread_order(n).astype(np.uintc).tobytes()))  # C unsigned int, same as array 'I'
+
+    def _spread_order(self, n):
+        """Cache indices for one shuffle round, each artist spread across it; a plain permutation when spacing can't matter."""
+        if n < 2 * self.artist_spacing + 1:
+            return np.random.permutation(n)  # Too few songs for spacing to be satisfiable
+        artist_codes = {}
+        codes = np.fromiter((artist_codes.setdefault(song.get('artist'), len(artist_codes)) for song in self.cache), dtype=np.intp, count=n)
+        if len(artist_codes) == 1:
+            return np.random.permutation(n)  # Single artist: nothing to spread
+        
+        # Random order within each artist: shuffle, then stable-group by artist
+        order = np.random.permutation(n)
+        order = order[np.argsort(codes[order], kind='stable')]
+        grouped = codes[order]
         
-        # Shuffle indices instead of the whole cache to save memory
-        self.upcoming_indices = list(range(len(self.cache)))
-        random.shuffle(self.upcoming_indices)
+        # Song k of an artist with c songs lands near (k + offset) / c, with a random offset per artist and a little jitter per song
+        counts = np.bincount(grouped)
+        rank = np.arange(n) - (np.cumsum(counts) - counts)[grouped]
+        offset = np.random.random(len(counts))[grouped]
+        jitter = np.random.uniform(-_SHUFFLE_JITTER, _SHUFFLE_JITTER, n)
+        position = (rank + offset + jitter) / counts[grouped]
+        return order[np.argsort(position, kind='stable')]
+
+    def peek_upcoming(self, limit):
+        """
+        Best guess at the next `limit` songs: queued replays first, then the shuffle order.
+        get_unique_song may still pass over some of them for history / artist spacing.
+        """
+        with self.lock:
+            songs = list(islice(self.replay_queue, limit))
+            for song_index in self.upcoming_indices.peek(limit - len(songs)):
+                if song_index < len(self.cache):
+                    songs.append(self.cache[song_index])
+            return songs
 
     def enqueue_replay(self, song):
         """
         Queues a specific song to be played next. This song will be played
         before any shuffled songs.
         """
-        self.replay_queue.insert(0, song)
+        self.replay_queue.appendleft(song)
 
     def get_unique_song(self):
         """
         Gets the next unique song, respecting history and artist spacing.
         This is the core logic of the shuffler.
         """
+        with self.lock:
+            return self._pick_unique_song()
+
+    def _pick_unique_song(self):
         if self.replay_queue:
-            song = self.replay_queue.pop(0)
+            song = self.replay_queue.popleft()
             # Add to history to avoid immediate repeat from shuffle
             self.history.append(song['path'])
             self.artist_history.append(song.get('artist'))
@@ -176,13 +523,13 @@ class SmartShuffler:
             if not self.upcoming_indices:
                 return None # No songs in cache
 
-        # Find a suitable song from the shuffled indices
-        for i in range(len(self.upcoming_indices)):
-            song_index = self.upcoming_indices.pop(0)
+        # Find a suitable song from the shuffled indices (bounded so huge libraries stay O(1) per pick)
+        for _ in range(min(len(self.upcoming_indices), self.MAX_REJECTS)):
+            song_index = self.upcoming_indices.popleft()
             song = self.cache[song_index]
             
             # Check history and artist spacing rules
-            is_in_history = song['path'] in self.history
+            is_in_history = self.history.recent[song_index]
             is_recent_artist = song.get('artist') in self.artist_history
             
             if not is_in_history and not is_recent_artist:
@@ -194,10 +541,10 @@ class SmartShuffler:
                 # Put it back at the end of the queue to try later
                 self.upcoming_indices.append(song_index)
 
-        # If we loop through the entire upcoming list and can't find a suitable song
+        # If we can't find a suitable song within the reject budget
         # (e.g., all remaining songs are by recent artists), just pick the next one.
         if self.upcoming_indices:
-            song_index = self.upcoming_indices.pop(0)
+            song_index = self.upcoming_indices.popleft()
             song = self.cache[song_index]
             self.history.append(song['path'])
             self.artist_history.append(song.get('artist'))
@@ -223,17 +570,18 @@ class MusicPlayer:
         # Playback control events
         self.skip_flag = Event()
         self.pause_event = Event()
+        self.resume_event = Event()  # Inverse of pause_event so paused loops can block until resume
+        self.resume_event.set()
         self.repeat_event = Event()
         self.downloading_youtube_song = Event()
         self.current_player_mode = Event()  # False = MusicPlayer, True = RadioPlayer
         
-        # Initialize Multiprocess Popup
-        self.close_event = multiprocessing.Event()
+        # Initialize Multiprocess Popup (fed one-way with (title, progress) tuples, None closes it)
         self.downloadPopup = DownloadPopup()
-        self.progress_value = multiprocessing.Value('d', 0.0)  # 'd' = double precision float
-        self.current_video = SharedString(max_size=20)
+        self.popup_proc = None
         if not fast_load:
-            self.popup_proc = multiprocessing.Process(target=self.downloadPopup.popup_process, args=(self.close_event, self.progress_value, self.current_video))
+            self._popup_q = multiprocessing.Queue()
+            self.popup_proc = multiprocessing.Process(target=self.downloadPopup.popup_process, args=(self._popup_q,))
             self.popup_proc.start()
         
         # Movement Debounce
@@ -245,62 +593,109 @@ class MusicPlayer:
         self.do_youtube_search = True # Whether to search youtube by default or just treat input as direct URL
 
         # UI callbacks
-        self.set_screen = set_screen
+        self._raw_set_screen = set_screen
+        self._last_screen = None  # (artist, title) last drawn; set_screen skips identical redraws
         self.set_duration = set_duration
-        self.set_lyrics = set_lyrics
+        self._raw_set_lyrics = set_lyrics
+        self._last_lyrics = None  # (shown, text) last sent for the current song; set_lyrics skips identical updates
         self.set_ips = set_ips
         self.is_afk = is_afk
 
         # Initialize YouTube
-        self.ytHandle = ytHandle(video_name_callback=self.current_video.set)
-        self.songDownloadThreads = []
+        self.ytHandle = ytHandle(video_name_callback=lambda title: self._post_download_progress(title=title))
+        self._download_pool = ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS, thread_name_prefix="yt-download")
+        self.songDownloadFutures = []  # Submitted by initialize_cache, drained by wait_for_yt
+        self._task_pool = ThreadPoolExecutor(max_workers=_TASK_WORKERS, thread_name_prefix="player-task")  # Short per-song jobs
+        self._yt_cached_path = str(Path.cwd() / ".youtubeCached.mp3")  # Temporary download target; the app never chdirs
+        self._yt_search_cache = OrderedDict()  # normalized term -> (timestamp, results), oldest first
+        self._yt_search_lock = Lock()
+        self._search_cache = OrderedDict()  # (query, max_results) -> (library size, results), oldest first
+        self._search_lock = Lock()
         
         # Initialize Lyric Handler
         self.lyricHandler = lyricHandler()
 
         # META Data
-        self.META_FILE = ".musicapp_meta.json"
+        self.META_DB = ".musicapp_meta.db"
+        self.LEGACY_META_FILES = (".musicapp_meta.pkl", ".musicapp_meta.json")  # Migrated into META_DB on first load
         self.meta = {}
+        self.meta_db = None
+        self._meta_lock = Lock()
+        self._meta_dirty = set()  # Paths whose rows need writing
+        self._meta_removed = set()  # Paths whose rows need deleting
         self.load_meta_cache()
         
         # Radio system
-        self.full_radio_ip_list = []
+        self.full_radio_ip_list = []  # Discovery order, shown in the UI
+        self._radio_ip_set = set()     # Same IPs, for O(1) de-dupe / validation
         self.current_radio_ip = "0.0.0.0"
         self.radio_client = RadioClient(AudioPlayer, ip=self.current_radio_ip)
         self.radio_master = RadioHost(self)
         self.radio_scanner = SimpleRadioScan()
         
-        # Cache & Shuffler
-        self.shuffler = SmartShuffler()
-        self.initializer_thread = Thread(target=self.initialize_cache, args=(directories,fast_load,), daemon=True)
-        self.initializer_thread.start()
-        self.songDownloadThreads.append(self.initializer_thread)
-        if not fast_load: self.wait_for_yt()
-
-        # Playback state
+        # Effects: the EQ lives as long as the AudioPlayer, the echo line comes and goes (see `echo`)
+        self._eq = AudioPlayer.eq
+        
+        # Playback state persistence (debounced background writer)
+        self._pending_state = None
+        self._last_state_payload = None  # Bytes last written, so an unchanged state is not rewritten
+        self._pending_save = Event()
+        Thread(target=self._playback_state_writer, daemon=True).start()
+        atexit.register(self.flush_playback_state)
+        
+        # Playback state (set before the cache thread starts: load_playback_state fills it in)
         self.current_song = None
+        self._resume = None  # (path, position) restored by load_playback_state, consumed when that song starts
+        self._last_published = None  # Whole second last pushed to set_duration by _publish_tick
+        self._song_ids = count(1)  # Per-play ids; lyric callbacks compare ints to detect stale songs
+        self.current_song_id = 0
         self.song_elapsed_seconds = 0.0
-        self.forward_stack = []
+        self._elapsed_cond = Condition()  # Notified when the song clock's anchor moves (new song, resume)
+        self._song_anchor = None  # monotonic() time at which the current song was at 0s, None while paused
+        self.forward_stack = deque()  # Paths stepped back over, next one on the right
         self.current_index = -1
         self.current_volume = 0.5
         self.navigating_history = False
         
+        # Cache & Shuffler
+        self.shuffler = SmartShuffler()
+        self.initializer_thread = Thread(target=self.initialize_cache, args=(directories,fast_load,), daemon=True)
+        self.initializer_thread.start()
+        if not fast_load: self.wait_for_yt()
+
         # Recommendations System
         self.recommend = PlayerRecommender()
 
+
 #####################################################################################################
     
     ### YOUTUBE INTEGRATION START ###
     
-    @lru_cache(maxsize=128)
     def get_youtube_search(self, search_term: str):
         """
         Passes a search query to the ytHandle and returns the results.
         Expected format: [["video title", "video url"], ...]
+        Results are cached per normalized term, bounded by size and age.
         """
-        if not search_term:
+        key = (search_term or "").strip().lower()
+        if not key:
             return []
-        return self.ytHandle.search_youtube(search_term)
+        
+        now = time()
+        with self._yt_search_lock:
+            entry = self._yt_search_cache.get(key)
+            if entry and now - entry[0] < _YT_SEARCH_CACHE_TTL:
+                self._yt_search_cache.move_to_end(key)
+                return entry[1]
+            self._yt_search_cache.pop(key, None)
+        
+        results = self.ytHandle.search_youtube(key)
+        
+        with self._yt_search_lock:
+            self._yt_search_cache[key] = (now, results)
+            while len(self._yt_search_cache) > _YT_SEARCH_CACHE_SIZE:
+                self._yt_search_cache.popitem(last=False)
+        return results
 
     def play_youtube_song(self, url: str):
         """
@@ -335,7 +730,7 @@ class MusicPlayer:
             self.play_song(youtube_song)
             if self.youtube_download_permanently:
                 ll.debug(f"Downloaded YouTube song for permanent playback: {youtube_song['title']}")
-                self.shuffler.cache.append(youtube_song)
+                self.shuffler.add_song(youtube_song)
             ll.debug(f"Queued YouTube song for playback: {youtube_song['title']}")
         else:
             ll.error(f"Failed to download or find the cached song for URL: {url}")
@@ -353,31 +748,48 @@ class MusicPlayer:
         if not query:
             return []
 
+        # Local results stay valid until the library grows (the cache is append-only)
+        if search_list is None:
+            cache_key, library_size = (query, max_results), len(self.shuffler.cache)
+            with self._search_lock:
+                entry = self._search_cache.get(cache_key)
+                if entry and entry[0] == library_size:
+                    self._search_cache.move_to_end(cache_key)
+                    return list(entry[1])
+
         # 1. Tokenize the search query and remove common "stop words" to get the keywords.
-        stop_words = {'by', 'the', 'a', 'an', 'in', 'on', 'ft', 'feat', 'and', '&'}
         # This splits the search by space, comma, dash, etc., and keeps only the important words.
-        search_tokens = [token for token in re.split(r'[\s.,_-]+', query) if token and token not in stop_words]
+        search_tokens = [token for token in _TOKEN_SPLIT.split(query) if token and token not in _STOP_WORDS]
         
         if not search_tokens:
             return []
 
-        results = []
-        search_list = search_list if search_list is not None else self.shuffler.cache
-        
-        for song in search_list:
-            song_type_is_dict = isinstance(song, dict)
-            if song_type_is_dict:
-                artist = song.get('artist', '')
-                title = song.get('title', '')
+        # Bounded min-heap of (score, order, song): only the best max_results survive, no full sort
+        best = []
+        if search_list is None:
+            # Local library: match against the prebuilt search index, no per-song string work.
+            # The trigram index narrows the scan to songs that contain every 3-letter piece of the keywords.
+            # Positions are collected under the shuffler lock; entries below the library size seen then never move.
+            cache, search_index = self.shuffler.cache, self.shuffler.search_index
+            with self.shuffler.lock:
+                positions = self.shuffler.search_candidates(search_tokens)
+                indexed = len(search_index)
+            if positions is None:
+                candidates = islice(zip(cache, search_index), indexed)
             else:
-                # This Must Be A Search From Youtube
-                artist, title = song[0].split(" - ", 1) if " - " in song[0] else ("", song[0])
-            
-            # 2. Create a "clean" version of the song's info for matching.
-            # This turns "Hans Zimmer - S.T.A.Y." into "hans zimmer s t a y".
-            combined_raw = f"{artist} {title}".lower()
-            # The regex removes all punctuation, making "s.t.a.y" match "stay".
-            combined_clean = re.sub(r'[^\w\s]', '', combined_raw)
+                candidates = ((cache[i], search_index[i]) for i in positions)
+        else:
+            candidates = ((song, None) for song in search_list)
+        
+        for order, (song, combined_clean) in enumerate(candidates):
+            if combined_clean is None:
+                if isinstance(song, dict):
+                    artist, title = song.get('artist', ''), song.get('title', '')
+                else:
+                    # This Must Be A Search From Youtube
+                    artist, title = song[0].split(" - ", 1) if " - " in song[0] else ("", song[0])
+                # 2. Create a "clean" version of the song's info for matching.
+                combined_clean = _search_key(artist, title)
             
             # 3. FILTER: Check if ALL search keywords are present in the song's info.
             # This is the most important step for accuracy.
@@ -391,17 +803,29 @@ class MusicPlayer:
             length_penalty = abs(len(combined_clean) - len(query))
             score -= length_penalty * 0.2  # Apply a small penalty for each extra character.
             
-            results.append({
-                'display': f"{artist} - {title}",
-                'path': song[1] if not song_type_is_dict else song['path'],
-                'score': score,
-                'type': song[2] if not song_type_is_dict else 'path'
-            })
-
-        # 5. Sort by the final score and return a short, highly relevant list of matches.
-        sorted_results = sorted(results, key=lambda x: x['score'], reverse=True)
+            # Earlier songs win ties, matching the old stable sort
+            entry = (score, -order, song)
+            if len(best) < max_results:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+
+        # 5. Return a short, highly relevant list of matches, best first.
+        results = []
+        for _, _, song in sorted(best, key=lambda entry: entry[:2], reverse=True):
+            if isinstance(song, dict):
+                results.append((f"{song.get('artist', '')} - {song.get('title', '')}", song['path'], 'path'))
+            else:
+                artist, title = song[0].split(" - ", 1) if " - " in song[0] else ("", song[0])
+                results.append((f"{artist} - {title}", song[1], song[2]))
         
-        return [(r['display'], r['path'], r['type']) for r in sorted_results[:max_results]]
+        if search_list is None:
+            with self._search_lock:
+                self._search_cache[cache_key] = (library_size, tuple(results))
+                self._search_cache.move_to_end(cache_key)
+                while len(self._search_cache) > _SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
+        return results
 
     def play_song(self, path_or_song):
         """
@@ -409,7 +833,7 @@ class MusicPlayer:
         """
         # Convert path to song dict if needed
         if isinstance(path_or_song, str):
-            song = next((s for s in self.shuffler.cache if s['path'] == path_or_song), None)
+            song = self.shuffler.by_path.get(path_or_song)
             if not song:
                 ll.warn(f"Song not found in cache: {path_or_song}")
                 return
@@ -434,11 +858,12 @@ class MusicPlayer:
 
         # Update history for direct plays (if not navigating history manually)
         # Don't add the temporary youtube cache file to permanent history
-        if not self.navigating_history and song['path'] != str(Path.cwd() / ".youtubeCached.mp3"):
+        if not self.navigating_history and song['path'] != self._yt_cached_path:
             # If we're playing a new song directly, add it to history and clear forward_stack
-            self._truncate_history()
-            self.shuffler.history.append(song['path'])
-            self.current_index = len(self.shuffler.history) - 1
+            with self.shuffler.lock:
+                self._truncate_history()
+                self.shuffler.history.append(song['path'])
+                self.current_index = len(self.shuffler.history) - 1
             self.forward_stack.clear() # Clear forward stack on new direct play
             
         # Pause Glitch Fix??
@@ -460,7 +885,7 @@ class MusicPlayer:
         # 1. Convert all search results into a list of song dictionary objects from the cache.
         playlist_songs = []
         for _display, path, _ in search_results:
-            song = next((s for s in self.shuffler.cache if s['path'] == path), None)
+            song = self.shuffler.by_path.get(path)
             if song:
                 playlist_songs.append(song)
 
@@ -514,27 +939,25 @@ class MusicPlayer:
         Set the gain of one ISO-centre band.
         Q is ignored because AudioEQ uses a fixed constant-Q design.
         """
-        eq = getattr(AudioPlayer, "eq", None)
-        if eq:
-            eq.set_gain(freq_hz, gain_db)
+        self._eq.set_gain(freq_hz, gain_db)
 
     def get_band(self, freq_hz: int, default: tuple[float, float] = (0.0, 1.0)):
         """
         Return (gain_dB, Q) for a single band.
-        Falls back to `default` if the band or EQ is missing.
+        Falls back to `default` if the band is missing.
         """
-        eq = getattr(AudioPlayer, "eq", None)
-        if eq:
-            return eq.get_band(freq_hz, default)
-        return default
+        return self._eq.get_band(freq_hz, default)
 
     def get_bands(self) -> dict[int, float]:
         """
-        Return the full {centre_freq_Hz: gain_dB} map,
-        or an empty dict when EQ isn't initialised.
+        Return the full {centre_freq_Hz: gain_dB} map.
         """
-        eq = getattr(AudioPlayer, "eq", None)
-        return eq.get_gains() if eq else {}
+        return self._eq.get_gains()
+
+    @property
+    def echo(self):
+        """The live AudioEcho line, or None while echo is disabled."""
+        return AudioPlayer.echo
 
     def enable_echo(self, delay_ms: int = 350,
                     feedback: float = 0.35,
@@ -556,21 +979,16 @@ class MusicPlayer:
                 feedback: float | None = None,
                 wet: float | None = None):
         """
-        Delegates to AudioPlayer.set_echo(), but auto-enables or disables
-        the effect when appropriate (delay>0 or wet>0 ⇒ enable, else disable).
+        Tweaks the live echo line, auto-enabling or disabling the effect
+        when appropriate (delay>0 or wet>0 ⇒ enable, both 0 ⇒ disable).
         """
-        # If echo line already exists, just tweak it
-        if getattr(AudioPlayer, "echo", None):
-            AudioPlayer.set_echo(delay_ms, feedback, wet)
-
-            # auto-disable when both delay and wet end up at 0
-            echo = AudioPlayer.echo
-            if echo and echo.delay_ms == 0 and echo.wet == 0:
+        echo = AudioPlayer.echo
+        if delay_ms == 0 and wet == 0:
+            if echo:
                 AudioPlayer.disable_echo()
-            return
-
-        # If no echo yet, enable when meaningful params come in
-        if (delay_ms or 0) > 0 or (wet or 0) > 0:
+        elif echo:
+            echo.set_params(delay_ms, feedback, wet)
+        elif (delay_ms or 0) > 0 or (wet or 0) > 0:
             AudioPlayer.enable_echo(delay_ms or 350,
                             feedback if feedback is not None else 0.35,
                             wet      if wet      is not None else 0.5)
@@ -579,36 +997,103 @@ class MusicPlayer:
 
     def load_meta_cache(self):
         """
-        Load persistent metadata (artist/title/duration) from disk.
+        Load persistent metadata (artist/title/duration) from the SQLite cache.
+        Rows are written incrementally by save_meta_cache; a legacy pickle/JSON cache is imported once.
         """
         try:
-            if os.path.exists(self.META_FILE):
-                with open(self.META_FILE, "r") as f:
-                    self.meta = json.load(f)
-            else:
-                self.meta = {}
+            self.meta_db = sqlite3.connect(self.META_DB, isolation_level=None, check_same_thread=False)
+            self.meta_db.execute("PRAGMA journal_mode=WAL")
+            self.meta_db.execute("PRAGMA synchronous=NORMAL")
+            self.meta_db.execute(
+                "CREATE TABLE IF NOT EXISTS meta ("
+                "path TEXT PRIMARY KEY, mtime REAL, size INTEGER, artist TEXT, title TEXT, duration REAL)"
+            )
+            rows = self.meta_db.execute("SELECT path, mtime, size, artist, title, duration FROM meta")
+            self.meta = {
+                path: {'artist': artist, 'title': title, 'duration': duration, 'mtime': mtime, 'size': size}
+                for path, mtime, size, artist, title, duration in rows
+            }
         except Exception as e:
             ll.warn(f"Failed to load metadata cache: {e}")
             self.meta = {}
+        if not self.meta:
+            self._migrate_legacy_meta()
+
+    def _migrate_legacy_meta(self):
+        """Import a whole-file metadata cache from older versions into the SQLite table."""
+        for legacy_file in self.LEGACY_META_FILES:
+            if not os.path.exists(legacy_file):
+                continue
+            try:
+                if legacy_file.endswith(".pkl"):
+                    with open(legacy_file, "rb") as f:
+                        legacy = pickle.load(f)
+                else:
+                    with open(legacy_file, "rb") as f:
+                        legacy = orjson.loads(f.read())
+                for path, metadata in legacy.items():
+                    self.set_meta(path, metadata)
+                self.save_meta_cache()
+                os.remove(legacy_file)
+                ll.debug(f"Migrated metadata cache from {legacy_file}")
+            except Exception as e:
+                ll.warn(f"Failed to migrate legacy metadata cache {legacy_file}: {e}")
+
+    def set_meta(self, path, metadata):
+        """Store metadata for a path in memory and mark its row for the next save."""
+        with self._meta_lock:
+            self.meta[path] = metadata
+            self._meta_dirty.add(path)
+            self._meta_removed.discard(path)
+
+    def remove_meta(self, paths):
+        """Drop metadata for paths in memory and mark their rows for deletion."""
+        with self._meta_lock:
+            for path in paths:
+                self.meta.pop(path, None)
+                self._meta_dirty.discard(path)
+                self._meta_removed.add(path)
 
     def save_meta_cache(self):
         """
-        Save updated metadata cache to disk.
+        Write changed metadata rows to disk (only rows touched since the last save).
         """
-        try:
-            with open(self.META_FILE, "w") as f:
-                json.dump(self.meta, f)
-        except Exception as e:
-            ll.error(f"Failed to save metadata cache: {e}")
+        if self.meta_db is None:
+            return
+        with self._meta_lock:
+            rows = [
+                (path, m.get('mtime'), m.get('size'), m.get('artist'), m.get('title'), m.get('duration'))
+                for path in self._meta_dirty if (m := self.meta.get(path))
+            ]
+            removed = [(path,) for path in self._meta_removed]
+            if not rows and not removed:
+                return
+            try:
+                self.meta_db.execute("BEGIN")
+                self.meta_db.executemany("INSERT OR REPLACE INTO meta (path, mtime, size, artist, title, duration) VALUES (?, ?, ?, ?, ?, ?)", rows)
+                self.meta_db.executemany("DELETE FROM meta WHERE path = ?", removed)
+                self.meta_db.execute("COMMIT")
+                self._meta_dirty.clear()
+                self._meta_removed.clear()
+            except Exception as e:
+                try:
+                    self.meta_db.execute("ROLLBACK")
+                except Exception:
+                    pass
+                ll.error(f"Failed to save metadata cache: {e}")
 
 #####################################################################################################
 
     def save_playback_state(self):
-        """Save the current song path and elapsed time to a file."""
+        """
+        Snapshot the current song path and elapsed time for saving.
+        The disk write happens on the background state writer, coalescing rapid calls.
+        """
         global save_playback_lock
-        if self.current_song:
+        song = self.current_song
+        if song:
             state = {
-                "path": self.current_song["path"],
+                "path": song["path"],
                 "elapsed": self.song_elapsed_seconds,
                 "paused": False if self.current_player_mode.is_set() else self.pause_event.is_set(),
                 "repeat": self.repeat_event.is_set(),
@@ -619,178 +1104,281 @@ class MusicPlayer:
                 "youtube_download_permanently": self.youtube_download_permanently,
                 "do_youtube_search": self.do_youtube_search
             }
+            with save_playback_lock:
+                self._pending_state = state
+            self._pending_save.set()
+
+    def flush_playback_state(self):
+        """
+        Write the latest pending playback state to disk (atomic replace).
+        A state identical to the last one written (e.g. while paused) is skipped.
+        Only the writer lock is held during I/O; the snapshot lock is held just for the swap,
+        so savers on the UI / playback threads never wait on the disk.
+        """
+        global save_playback_lock, state_writer_lock
+        with state_writer_lock:
+            with save_playback_lock:
+                state, self._pending_state = self._pending_state, None
+            if state is None:
+                return
+            payload = orjson.dumps(state)
+            if payload == self._last_state_payload:
+                return
+            temp_path = self.SAVE_STATE_FILE + ".tmp"
             try:
-                with save_playback_lock:
-                    if self.current_song["path"] == state['path']:
-                        with open(self.SAVE_STATE_FILE, "w") as f:
-                            json.dump(state, f)
+                with open(temp_path, "wb") as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())  # Data must be on disk before the rename, or a power cut can leave an empty state file
+                os.replace(temp_path, self.SAVE_STATE_FILE)
+                self._last_state_payload = payload
             except Exception as e:
                 ll.error(f"Failed to save playback state: {e}")
 
+    def _playback_state_writer(self):
+        """Single background writer: waits for a save request, debounces, then writes once."""
+        while True:
+            self._pending_save.wait()
+            sleep(_STATE_SAVE_DEBOUNCE)
+            self._pending_save.clear()
+            self.flush_playback_state()
+
     def load_playback_state(self):
-        global save_playback_lock
         try:
-            self.resume_pending = True
-            with save_playback_lock:
-                with open(self.SAVE_STATE_FILE, "r") as f:
-                    state = json.load(f)
-                path = state.get("path")
-                elapsed = state.get("elapsed", 0)
-                paused = state.get("paused", False)
-                repeat = state.get("repeat", False)
-                volume = state.get("volume", 0.1)
-                gaming_mode = state.get("gaming_mode", True)
-                accept_radio_eq = state.get("accept_radio_eq", True)
-                self.current_radio_ip = state.get("current_radio_ip", "0.0.0.0")
-                self.youtube_download_permanently = state.get("youtube_download_permanently", False)
-                self.do_youtube_search = state.get("do_youtube_search", True)
-                
-                self.set_volume(volume, True)
-                self.toggle_gaming_mode(gaming_mode)
-                self.set_accepting_radio_eq(accept_radio_eq)
-                
-                if path and os.path.exists(path):
-                    # Find the song dict in cache
-                    song = next((s for s in self.shuffler.cache if s["path"] == path), None)
-                    if not song:
-                        metadata = self.meta.get(path)
-                        if metadata:
-                            self.shuffler.cache.append(metadata)
-                            self.shuffler._refill_upcoming()
-                        
-                    self.current_song = song
-                    self._resume_position = float(elapsed)
-                    self.shuffler.enqueue_replay(song)
-
-                    # Restore repeat state
-                    if repeat:
-                        self.repeat_event.set()
-                    else:
-                        self.repeat_event.clear()
+            # No lock needed: the state file is only ever swapped in whole by os.replace
+            with open(self.SAVE_STATE_FILE, "rb") as f:
+                state = orjson.loads(f.read())
+            path = state.get("path")
+            elapsed = state.get("elapsed", 0)
+            paused = state.get("paused", False)
+            repeat = state.get("repeat", False)
+            volume = state.get("volume", 0.1)
+            gaming_mode = state.get("gaming_mode", True)
+            accept_radio_eq = state.get("accept_radio_eq", True)
+            self.current_radio_ip = state.get("current_radio_ip", "0.0.0.0")
+            self.youtube_download_permanently = state.get("youtube_download_permanently", False)
+            self.do_youtube_search = state.get("do_youtube_search", True)
+            
+            self.set_volume(volume, True)
+            self.toggle_gaming_mode(gaming_mode)
+            self.set_accepting_radio_eq(accept_radio_eq)
+            
+            if path and os.path.exists(path):
+                # Find the song dict in cache
+                song = self.shuffler.by_path.get(path)
+                if not song:
+                    metadata = self.meta.get(path)
+                    if metadata and self._cache_song(path, metadata):
+                        song = self.shuffler.by_path[path]
+                        self.shuffler._refill_upcoming()
+                    
+                self.current_song = song
+                self._resume = (song['path'], float(elapsed))
+                self.shuffler.enqueue_replay(song)
 
-                    # Restore pause state
-                    Thread(target=self.pause_after_mixer_ready, args=(paused,), daemon=True).start()
+                # Restore repeat state
+                if repeat:
+                    self.repeat_event.set()
+                else:
+                    self.repeat_event.clear()
 
-                    # Update UI to reflect restored state
-                    self.set_screen(self.current_song['artist'], self.get_display_title())
+                # Restore pause state
+                Thread(target=self.pause_after_mixer_ready, args=(paused,), daemon=True).start()
 
-                    return True
+                # Update UI to reflect restored state
+                self.set_screen(self.current_song['artist'], self.get_display_title())
+
+                return True
         except Exception as e:
             ll.warn(f"Failed to load playback state: {e}")
-            self.resume_pending = False
+            self._resume = None
         return False
 
     def initialize_cache(self, directories, fast_load: bool = False):
         supported_extensions = ('.mp3', '.wav', '.ogg', '.flac')
         unique_paths = set()  # Track unique paths to avoid duplicates
+        misses = []  # (path, mtime, size) needing a fresh metadata read
         for path in directories:
             if path.startswith('http') and not fast_load:
-                newThread = Thread(target=self.ytDownload, args=(path, directories,))
-                newThread.start()
-                self.songDownloadThreads.append(newThread)
+                self.songDownloadFutures.append(self._download_pool.submit(self.ytDownload, path, directories))
                 continue
-            for root, _, files in os.walk(path):
-                for file in files:
-                    full_path = os.path.join(root, file)
-                    if full_path in unique_paths or not self.verify_file_ok(full_path):
-                        continue
-                    unique_paths.add(full_path)
-                    if not file.lower().endswith(supported_extensions):
-                        continue
+            # Local roots skip the placeholder test once a sample of their files comes back clean
+            check_placeholders = self._may_hold_placeholders(path)
+            probed = 0
+            for entry in self._scan_files(path):
+                full_path = entry.path
+                # Cheap name checks first; only audio files are stat'd / verified
+                if full_path in unique_paths or not entry.name.lower().endswith(supported_extensions):
+                    continue
+                try:
+                    st = entry.stat(follow_symlinks=False)  # Cached by DirEntry (free on Windows)
+                except OSError:
+                    continue
+                if not check_placeholders and probed < _PLACEHOLDER_PROBE:
+                    probed += 1
+                    check_placeholders = bool(getattr(st, 'st_file_attributes', 0) & _PLACEHOLDER_MASK)
+                if not self._stat_ok(full_path, st, check_placeholders):
+                    continue
+                unique_paths.add(full_path)
+                mtime, size = st.st_mtime, st.st_size
+
+                # Use cached metadata if available, otherwise queue for the parallel tag read
+                cached_metadata = self.meta.get(full_path)
+                if not cached_metadata or (mtime and cached_metadata.get('mtime') != mtime) or (size and cached_metadata.get('size') != size):
+                    misses.append((full_path, mtime, size))
+                else:
+                    self._cache_song(full_path, cached_metadata)
                     
-                    try:
-                        st = os.stat(follow_symlinks=False)
-                        mtime, size = st.st_mtime, st.st_size
-                    except Exception:
-                        mtime = size = None
-
-                    # Use cached metadata if available
-                    cached_metadata = self.meta.get(full_path)
-                    if not cached_metadata or (mtime and cached_metadata.get('mtime') != mtime) or (size and cached_metadata.get('size') != size):
-                        metadata = self.get_metadata(full_path)
-                        metadata.update({'mtime': mtime, 'size': size})
-                        self.meta[full_path] = metadata
-                        cached_metadata = metadata
-
-                    duration = cached_metadata.get('duration', 0.0)
-                    if self.check_song_length(duration):
-                        self.shuffler.cache.append({
-                            'path': full_path,
-                            'artist': cached_metadata.get('artist', 'Unknown Artist'),
-                            'title': cached_metadata.get('title', os.path.splitext(file)[0]),
-                            'duration': duration
-                        })
-                        
-                    if fast_load and len(self.shuffler.cache) >= self.fast_load_limit:
-                        ll.debug(f"Fast load: stopping after {self.fast_load_limit} songs")
-                        break
-                        
-        # Remove cache entries for files that no longer exist
-        removed = set(self.meta) - unique_paths
-        for path in removed:
-            del self.meta[path]
+                if fast_load and len(self.shuffler.cache) + len(misses) >= self.fast_load_limit:
+                    ll.debug(f"Fast load: stopping after {self.fast_load_limit} songs")
+                    break
+
+        # Parse tags for new / changed files concurrently; mutagen is I/O bound
+        if misses:
+            with closing(self.get_metadata_bulk([m[0] for m in misses])) as results:
+                for parsed, ((full_path, mtime, size), metadata) in enumerate(zip(misses, results), 1):
+                    metadata.update({'mtime': mtime, 'size': size})
+                    self.set_meta(full_path, metadata)
+                    self._cache_song(full_path, metadata)
+                    if parsed % _META_FLUSH_EVERY == 0:
+                        self.save_meta_cache()  # Persist progress mid-scan
+                    
+        # Remove cache entries for files that no longer exist (a fast-load scan is partial, keep everything)
+        if not fast_load:
+            stale = self.meta.keys() - unique_paths  # Set op on the keys view, no copy of meta
+            if stale:
+                self.remove_meta(stale)
             
         # Refill upcoming queue after cache is populated
         self.shuffler._refill_upcoming()
-        # Save cache
-        self.save_meta_cache()
+        # Save cache (only when the scan added, changed or removed rows)
+        if self._meta_dirty or self._meta_removed:
+            self.save_meta_cache()
         # Load Playback State
         if not fast_load: self.load_playback_state()
 
 #####################################################################################################
 
+    def _scan_files(self, root_dir):
+        """
+        Recursively yield file DirEntry objects under root_dir using os.scandir,
+        so name, path and stat come from the directory listing instead of extra syscalls.
+        """
+        pending = [root_dir]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                yield entry
+                        except OSError:
+                            continue
+            except OSError as e:
+                ll.debug(f"Cannot scan {current}: {e}")
+
     def ytDownload(self, url, possibleDirectories):
         returnedPaths = self.ytHandle.parseUrl(url, possibleDirectories)
-        for path in returnedPaths:
-            filename = os.path.basename(path)
-            metadata = self.get_metadata(path)
-            duration = metadata.get('duration', 0.0)
-            if self.check_song_length(duration):
-                self.shuffler.cache.append({
-                    'path': path,
-                    'artist': metadata.get('artist', 'Unknown Artist'),
-                    'title': metadata.get('title', os.path.splitext(filename)[0]),
-                    'duration': duration
-                })
-            else:
-                ll.debug(f"🚨 File Duration ({duration}) Was Not Enough For It To Qualify")
+        with closing(self.get_metadata_bulk(returnedPaths)) as results:
+            for path, metadata in zip(returnedPaths, results):
+                if not self._cache_song(path, metadata):
+                    ll.debug(f"🚨 File Duration ({metadata.get('duration', 0.0)}) Was Not Enough For It To Qualify")
         ll.debug(f"⏬ Download Completed: {url}")
     
+    def _cache_song(self, path, metadata) -> bool:
+        """Append a song entry built from metadata to the shuffler cache if its length qualifies."""
+        duration = metadata.get('duration', 0.0)
+        if not (_SKIP_TIME_LENGTH_MIN <= duration <= _SKIP_TIME_LENGTH_MAX):
+            return False
+        title = metadata.get('title')
+        if title is None:  # Only split the path when the tags had no title
+            title = os.path.splitext(os.path.basename(path))[0]
+        self.shuffler.add_song({
+            'path': path,
+            'artist': metadata.get('artist', 'Unknown Artist'),
+            'title': title,
+            'duration': duration
+        })
+        return True
+    
+    def _post_download_progress(self, title=None, progress=None):
+        """Send a (title, progress) update to the download popup; None leaves that field unchanged."""
+        if self.popup_proc is None:
+            return
+        try:
+            self._popup_q.put_nowait((title, progress))
+        except Exception as E:
+            ll.debug(f"Popup Update Dropped: {E}")
+
     def wait_for_yt(self):
         ll.debug("Awaiting Youtube To Finish")
 
-        # Wait for all downloads to complete
-        currentThreadIndex = 0
-        while currentThreadIndex < len(self.songDownloadThreads):
+        # The scan submits a download per playlist URL it meets; once it finishes the list is complete
+        self._post_download_progress(progress=0)
+        self.initializer_thread.join()
+
+        # Advance the progress bar as downloads finish, in whatever order they finish
+        futures = self.songDownloadFutures
+        for finished, future in enumerate(as_completed(futures), 1):
+            self._post_download_progress(progress=finished / len(futures))
             try:
-                if currentThreadIndex <= 0:
-                    self.progress_value.value = 0
-                else:
-                    self.progress_value.value = currentThreadIndex / len(self.songDownloadThreads)
-                self.songDownloadThreads[currentThreadIndex].join()
-                currentThreadIndex += 1
+                future.result()
             except Exception as E:
-                ll.debug(f"Thread Waiting Error: {E}")
-                continue
+                ll.debug(f"Download Error: {E}")
+        self._download_pool.shutdown(wait=False)
 
         # Close popup if it was shown
         if self.popup_proc:
-            self.close_event.set()
+            self._popup_q.put(None)
             self.popup_proc.join()
+            self.popup_proc = None
 
         ll.debug("Finished Full Download List")
 
 #####################################################################################################
 
+    def get_metadata_bulk(self, paths):
+        """
+        Read metadata for many files on a thread pool (tag reads are I/O bound).
+        Yields results in the same order as `paths` as they become available.
+        The pool shuts down when the generator finishes or is closed; callers that may stop early
+        (zip() stops before asking for one more) wrap it in contextlib.closing.
+        """
+        with ThreadPoolExecutor(max_workers=_METADATA_WORKERS) as pool:
+            yield from pool.map(self.get_metadata, paths)
+
     def get_metadata(self, file_path):
         """
         Pull artist, title, and duration (in seconds).  
         If we can't read length, duration=None.
+        Plain ID3v2-tagged MP3s and FLAC files are read directly; everything else goes through mutagen,
+        opened with the format class for its extension when there is one.
         """
+        stem, ext = os.path.splitext(os.path.basename(file_path))  # Split once; stem is the fallback title
+        ext = ext.lower()
+        probe = _FAST_PROBES.get(ext)
+        if probe:
+            try:
+                metadata = probe(file_path)
+                if metadata:
+                    return metadata
+            except Exception:
+                pass  # Fall through to the full parse
         try:
-            audio = File(file_path, easy=True)
+            audio = None
+            opener = _MUTAGEN_BY_EXT.get(ext)
+            if opener:
+                try:
+                    audio = opener(file_path)
+                except Exception:
+                    pass  # Mislabelled container; let mutagen sniff it
+            if audio is None:
+                audio = File(file_path, easy=True)
             # fallback title from filename
-            title = audio.get('title', [os.path.splitext(os.path.basename(file_path))[0]])[0]
+            title = audio.get('title', [stem])[0]
             artist = audio.get('artist', ['Unknown Artist'])[0]
             # try to get duration
             try:
@@ -802,7 +1390,7 @@ class MusicPlayer:
         except Exception:
             return {
                 'artist': 'Unknown Artist',
-                'title': os.path.splitext(os.path.basename(file_path))[0],
+                'title': stem,
                 'duration': 0.0
             }
 
@@ -816,8 +1404,10 @@ class MusicPlayer:
         should_unpause = forcedState if forcedState is not None else self.pause_event.is_set()
         if should_unpause:
             self.pause_event.clear()
+            self.resume_event.set()
             AudioPlayer.unpause()
         else:
+            self.resume_event.clear()
             self.pause_event.set()
             AudioPlayer.pause()
         self.set_screen(self.current_song['artist'], self.get_display_title())
@@ -852,7 +1442,7 @@ class MusicPlayer:
             self.navigating_history = True
             self.current_index += 1
             next_path = self.forward_stack.pop()
-            next_song = next((s for s in self.shuffler.cache if s['path'] == next_path), None)
+            next_song = self.shuffler.by_path.get(next_path)
             if next_song:
                 self._queue_song(next_song)
             self.navigating_history = False
@@ -860,8 +1450,9 @@ class MusicPlayer:
             self._clear_for_new_track()
             new_song = self.get_unique_song()
             if new_song:
-                self._truncate_history()
-                self.shuffler.history.append(new_song['path'])
+                with self.shuffler.lock:
+                    self._truncate_history()
+                    self.shuffler.history.append(new_song['path'])
                 self.current_index += 1
                 self.forward_stack.clear()
                 self._queue_song(new_song)
@@ -890,7 +1481,7 @@ class MusicPlayer:
             self.forward_stack.append(self.shuffler.history[self.current_index])
             self.current_index -= 1
             prev_path = self.shuffler.history[self.current_index]
-            prev_song = next((s for s in self.shuffler.cache if s['path'] == prev_path), None)
+            prev_song = self.shuffler.by_path.get(prev_path)
             if prev_song:
                 self._queue_song(prev_song)
             self.navigating_history = False
@@ -907,7 +1498,7 @@ class MusicPlayer:
         if set_directly:
             self.current_volume = direction
         else:
-            self.current_volume = round(sorted([0.0, self.current_volume + direction, 1.0])[1], 2)
+            self.current_volume = round(max(0.0, min(1.0, self.current_volume + direction)), 2)
         AudioPlayer.set_volume(self.current_volume, set_directly=True)
         ll.debug(f"🔊 {self.current_volume}")
         
@@ -922,26 +1513,52 @@ class MusicPlayer:
 
 #####################################################################################################
 
-    @lru_cache(maxsize=256)
     def check_song_length(self, duration: float = 0.0):
         """Figures out if the duration is the right length to be kept. True if yes False if no"""
-        return (duration >= _SKIP_TIME_LENGTH_MIN) and (duration <= _SKIP_TIME_LENGTH_MAX)
+        return _SKIP_TIME_LENGTH_MIN <= duration <= _SKIP_TIME_LENGTH_MAX
     
-    @lru_cache(maxsize=256)
-    def verify_file_ok(self, path: str) -> None:
-        """
-        One fast stat call:
-        • raises FileNotFoundError if path missing / not regular file
-        • raises OSError for 0-byte files or OneDrive placeholders
-        """
-        st = os.stat(path, follow_symlinks=False)
-        if not os.path.isfile(path) or st.st_size == 0 or st.st_file_attributes & _PLACEHOLDER_MASK:
+    def _stat_ok(self, path: str, st: os.stat_result, check_placeholders: bool = True) -> bool:
+        """Check an existing stat result: regular, non-empty, and (unless trusted) not a cloud placeholder."""
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0 or (check_placeholders and getattr(st, 'st_file_attributes', 0) & _PLACEHOLDER_MASK):
             ll.debug(f"{path} will not work with Media Player! Skipping.")
             return False
         return True
 
+    def _may_hold_placeholders(self, root: str) -> bool:
+        """True when a library root lies inside a OneDrive folder, so every file needs the placeholder test."""
+        if os.name != 'nt':
+            return False  # st_file_attributes only exists on Windows
+        root = os.path.normcase(os.path.abspath(root))
+        for var in _CLOUD_ROOT_VARS:
+            cloud = os.environ.get(var)
+            if not cloud:
+                continue
+            cloud = os.path.normcase(os.path.abspath(cloud))
+            try:
+                if os.path.commonpath([root, cloud]) in (root, cloud):
+                    return True
+            except ValueError:
+                continue  # Different drives
+        return False
+
 #####################################################################################################
 
+    def set_screen(self, artist, title):
+        """Forward an (artist, title) pair to the UI, skipping the redraw when it matches what is already shown."""
+        key = (artist, title)
+        if key == self._last_screen:
+            return
+        self._last_screen = key
+        self._raw_set_screen(*key)
+
+    def set_lyrics(self, show: bool = True, lyrics: str = ''):
+        """Forward a lyric line (or hide the lyrics) to the UI, skipping updates identical to what is already shown."""
+        key = (show, lyrics)
+        if key == self._last_lyrics:
+            return
+        self._last_lyrics = key
+        self._raw_set_lyrics(show, lyrics)
+
     def get_display_title(self, specific_song=None):
         """Return the current song title with repeat and pause markers as needed."""
         if not specific_song: specific_song = self.current_song
@@ -958,20 +1575,19 @@ class MusicPlayer:
         self.hold_thread_until_mixer()
         self.pause(not paused)
 
-    def hold_thread_until_mixer(self):
+    def hold_thread_until_mixer(self, timeout: float = None):
         """
         Wait until the mixer is ready and playing music.
+        Returns False if `timeout` seconds pass first.
         """
-        while not AudioPlayer.get_busy():
-            sleep(1)
-        return True
+        return AudioPlayer.playing.wait(timeout)
 
 #####################################################################################################
 
     def _clear_for_new_track(self):
         self.skip_flag.set()
-        self.forward_stack = []
-        self.shuffler.replay_queue = []  # Clear queue for new selection
+        self.forward_stack.clear()
+        self.shuffler.replay_queue.clear()  # Clear queue for new selection
         if self.current_index < len(self.shuffler.history) - 1:
             self._truncate_history()
 
@@ -987,10 +1603,7 @@ class MusicPlayer:
             self.shuffler.history = self.shuffler.history[:self.current_index + 1]
             return
 
-        num_to_remove = len(self.shuffler.history) - (self.current_index + 1)
-        if num_to_remove > 0:
-            for _ in range(num_to_remove):
-                self.shuffler.history.pop()
+        self.shuffler.history.truncate(self.current_index + 1)
 
     def get_unique_song(self):
         # Delegate to SmartShuffler
@@ -1000,12 +1613,14 @@ class MusicPlayer:
 
     def resetRadio(self):
         try:
-            self.radio_client.stopListening()
-        except:
-            pass
-        # Possibly important I dont know lol I just removed it and everything fixed lol ##
-        del self.radio_client
-        self.radio_client = RadioClient(AudioPlayer, ip=self.current_radio_ip)
+            self.radio_client.reset(self.current_radio_ip)
+        except Exception as E:
+            ll.warn(f"Radio client reset failed ({E}); rebuilding it")
+            try:
+                self.radio_client.stopListening()
+            except:
+                pass
+            self.radio_client = RadioClient(AudioPlayer, ip=self.current_radio_ip)
         
     def load_radio_ips(self, seconds_to_scan: int = 60):
         """
@@ -1013,7 +1628,8 @@ class MusicPlayer:
         Run Only In A Seperate Daemon Thread
         """
         def handle_callback_ip(ip, title, location):
-            if not ip in self.full_radio_ip_list and not ip.__contains__("0.0.0.0"):
+            if ip not in self._radio_ip_set and "0.0.0.0" not in ip:
+                self._radio_ip_set.add(ip)
                 self.full_radio_ip_list.append(ip)
                 if self.current_radio_ip == "0.0.0.0":
                     self.current_radio_ip = ip
@@ -1024,7 +1640,7 @@ class MusicPlayer:
             sleep(seconds_to_scan)
 
     def set_radio_ip(self, new_ip):
-        if new_ip in self.full_radio_ip_list:
+        if new_ip in self._radio_ip_set:
             self.toggle_loop_cycle()
             self.current_radio_ip = new_ip
             self.toggle_loop_cycle()
@@ -1077,21 +1693,28 @@ class MusicPlayer:
         def lyric_callback(unformatted_return_lyrics: str, return_dilation, local_song_id):
             self.current_radio_id = local_song_id
             try:
-                attemptCount = 0
-                attemptTries = 3
-                while (attemptCount := attemptCount + 1) <= attemptTries:
+                content = b""
+                for attempt in range(_RADIO_LYRIC_ATTEMPTS):
                     try:
-                        lyric_data = requests.get(unformatted_return_lyrics, timeout=2)
-                        lyric_data.raise_for_status()
-                        if lyric_data.content != "b''" and len(lyric_data.content) > 12:
+                        with _RADIO_LYRIC_SESSION.get(unformatted_return_lyrics, timeout=2, stream=True) as lyric_data:
+                            lyric_data.raise_for_status()
+                            declared = lyric_data.headers.get("Content-Length")
+                            if declared is None or int(declared) > _RADIO_LYRIC_MIN_BYTES:  # Skip reading bodies the host says are empty
+                                content = lyric_data.content
+                        if len(content) > _RADIO_LYRIC_MIN_BYTES:
                             ll.debug(f"Lyrics downloaded.")
                             break
-                        else:
-                            sleep(2)
                     except Exception as E:
-                        ll.error(f"Radio Lyric Download Error {E} on attempt {attemptCount}/{attemptTries}")
-                        sleep(2)
-                return_lyrics = ast.literal_eval(lyric_data.content.decode('utf-8'))
+                        ll.error(f"Radio Lyric Download Error {E} on attempt {attempt + 1}/{_RADIO_LYRIC_ATTEMPTS}")
+                    if attempt + 1 < _RADIO_LYRIC_ATTEMPTS:
+                        sleep(0.5 * 2 ** attempt)  # 0.5s, 1s, ...
+                if len(content) <= _RADIO_LYRIC_MIN_BYTES:
+                    self.set_lyrics(False)
+                    return
+                try:
+                    return_lyrics = orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    return_lyrics = ast.literal_eval(content.decode('utf-8'))  # Older hosts send a Python repr
                 if len(return_lyrics) > 0:
                     self.set_lyrics(True, "🎵")
                     for lyric_pair in return_lyrics:
@@ -1100,10 +1723,9 @@ class MusicPlayer:
                         if not self.current_player_mode.is_set():
                             self.set_lyrics(False)
                             break
-                        while self.radio_client.get_client_data()['radio_duration'][0] < lyric_pair[0]: # While Less Than Required Time For Lyrics To Show
-                            if not self.current_player_mode.is_set() or not local_song_id == self.current_radio_id:
-                                break
-                            sleep(0.25)
+                        # Sleep until the lyric is due (or the radio stops / changes song); woken by each position update
+                        self._wait_until(self.radio_client.position_changed, lambda: self.radio_client.get_client_data()['radio_duration'][0] >= lyric_pair[0]
+                                         or not self.current_player_mode.is_set() or local_song_id != self.current_radio_id)
                         self.set_lyrics(True, lyric_pair[1])
                 self.set_lyrics(False)
             except Exception as E:
@@ -1124,20 +1746,82 @@ class MusicPlayer:
             
             self.set_lyrics(False)
             
+            last_radio_text = None  # "artist![]!title" last drawn; the connect message is on screen now
+            last_radio_clock = None  # (whole second, song length) last sent to set_duration
             while True:
                 if not self.current_player_mode.is_set() or listeningIp != self.current_radio_ip:
                     ll.print("Exiting Radio Loop.")
                     break
                 RadioData = self.radio_client.get_client_data()
-                self.set_duration(*RadioData['radio_duration'])
-                self.set_screen(*RadioData['radio_text'].split("![]!"))
-                sleep(1)
+                position, length = RadioData['radio_duration']
+                radio_clock = (int(position), length)
+                if radio_clock != last_radio_clock:
+                    self.set_duration(position, length)
+                    last_radio_clock = radio_clock
+                radio_text = RadioData['radio_text']
+                if radio_text != last_radio_text:
+                    artist, _, title = radio_text.partition("![]!")
+                    self.set_screen(artist, title)
+                    last_radio_text = radio_text
+                # Redraw as soon as the client publishes a new position; the timeout keeps the exit checks live
+                with self.radio_client.position_changed:
+                    self.radio_client.position_changed.wait(_RADIO_DISPLAY_TIMEOUT)
             try:
                 self.radio_client.stopListening()
                 ll.print(f"Stopped listening To {listeningIp}.")
             except:
                 pass
 
+    def _prefetch_upcoming_lyrics(self):
+        try:
+            upcoming = self.shuffler.peek_upcoming(_LYRIC_PREFETCH_COUNT)
+            self.lyricHandler.prefetch([(song['artist'], song['title']) for song in upcoming if song['path'] != self._yt_cached_path])
+        except Exception as E:
+            ll.debug(f"Lyric Prefetch Error: {E}")
+
+    def _set_song_anchor(self, anchor):
+        """Move the song clock's anchor and wake lyric threads so they recompute their deadlines."""
+        with self._elapsed_cond:
+            self._song_anchor = anchor
+            self._elapsed_cond.notify_all()
+
+    def _wait_for_song_position(self, position, song_id):
+        """
+        Sleep until the current song reaches `position` seconds or a different song starts.
+        The deadline is absolute (anchor + position), so waits don't accumulate tick or sleep error;
+        pause / resume / song changes move the anchor and wake the wait to recompute it.
+        """
+        with self._elapsed_cond:
+            while song_id == self.current_song_id:
+                timeout = _LYRIC_RECHECK_INTERVAL
+                if self._song_anchor is not None:
+                    remaining = self._song_anchor + position - monotonic()
+                    if remaining <= 0:
+                        return
+                    timeout = min(remaining, timeout)
+                self._elapsed_cond.wait(timeout)
+
+    @staticmethod
+    def _wait_until(cond, predicate):
+        """
+        Block on cond until predicate() holds.
+        Rechecks every _LYRIC_RECHECK_INTERVAL seconds in case the notifier went away (radio client rebuilt, loop stopped).
+        """
+        with cond:
+            while not cond.wait_for(predicate, timeout=_LYRIC_RECHECK_INTERVAL):
+                pass
+
+    def _publish_tick(self, song, elapsed, total_duration):
+        """
+        Push position and title to the UI for one playback tick, calling each setter only when its output changes.
+        The clock only shows whole seconds; the title only changes with pause / repeat toggles.
+        """
+        whole_second = int(elapsed)
+        if self._last_published != whole_second:
+            self.set_duration(elapsed, total_duration)
+            self._last_published = whole_second
+        self.set_screen(song['artist'], self.get_display_title())
+
     def core_player_loop(self):
         prev_song = None
         is_first_run = True
@@ -1157,15 +1841,18 @@ class MusicPlayer:
 
                 # history and played lists maintained in shuffler, so skip duplicates here
                 if not self.navigating_history:
-                    self._truncate_history()
-                    if not self.shuffler.history or self.shuffler.history[-1] != song['path']:
-                        # Don't add the temporary youtube cache file to permanent history
-                        if song['path'] != str(Path.cwd() / ".youtubeCached.mp3"):
-                            self.shuffler.history.append(song['path'])
-                            self.current_index = len(self.shuffler.history) - 1
+                    with self.shuffler.lock:
+                        self._truncate_history()
+                        if not self.shuffler.history or self.shuffler.history[-1] != song['path']:
+                            # Don't add the temporary youtube cache file to permanent history
+                            if song['path'] != self._yt_cached_path:
+                                self.shuffler.history.append(song['path'])
+                                self.current_index = len(self.shuffler.history) - 1
 
                 self.current_song = song
-                self.current_song_id = str(song['title']) + str(time())
+                self.current_song_id = next(self._song_ids)
+                self._last_lyrics = None  # A new song always sends its first lyric update, even if it matches the last song's
+                self._set_song_anchor(None)  # Lyric waits for the previous song see the id change
                 self.set_screen(song['artist'], self.get_display_title())
                 self.current_song_lyrics = ""
 
@@ -1182,44 +1869,37 @@ class MusicPlayer:
                             if not local_song_id == self.current_song_id:
                                 self.set_lyrics(False)
                                 break
-                            while self.song_elapsed_seconds < lyric_pair[0]: # While Less Than Required Time For Lyrics To Show
-                                if not local_song_id == self.current_song_id:
-                                    break
-                                sleep(0.25)
+                            self._wait_for_song_position(lyric_pair[0], local_song_id)
                             self.set_lyrics(True, lyric_pair[1])
                     else:
                         self.set_lyrics(False)
 
-                # lyric thread
-                Thread(target=self.lyricHandler.request,
-                       args=(song['artist'], song['title'], lyric_callback, self.current_song_id), daemon=True).start()
+                # lyric request (only queues the lookup, so a pooled worker frees up at once)
+                self._task_pool.submit(self.lyricHandler.request, song['artist'], song['title'], lyric_callback, self.current_song_id)
+                # Warm the lyric cache for the songs likely to follow while this one plays
+                self._task_pool.submit(self._prefetch_upcoming_lyrics)
 
                 try:
                     AudioPlayer.load(song['path'])
                     AudioPlayer.set_volume(self.current_volume, set_directly=True)
                     
-                    # Simplified resume logic - if we're resuming and this is the correct song
-                    # In core_player_loop, replace the resume block with:
-                    if getattr(self, "resume_pending", False) and self.current_song and self.current_song['path'] == song['path']:
-                        start_pos = getattr(self, '_resume_position', 0.0)
+                    # Resume where the saved state left off, once, and only for the song it was saved for
+                    resume, self._resume = self._resume, None
+                    if resume and resume[0] == song['path']:
+                        start_pos = resume[1]
                         AudioPlayer.play()
                         try:
                             AudioPlayer.set_pos(start_pos)
                         except Exception as e:
                             try:
-                                AudioPlayer.play(start=start_pos)
+                                AudioPlayer.play(song['path'], start_pos=start_pos)
                                 ll.debug(f"Used alternative method to start at {start_pos:.2f}s")
                             except Exception as e:
                                 ll.error(f"Alternative method also failed: {e}")
-                        
-                        self.resume_pending = False
-                        if hasattr(self, '_resume_position'):
-                            del self._resume_position
                     else:
                         start_pos = 0.0
                         AudioPlayer.play() # pygame.mixer.music.play()
-                        self.hold_thread_until_mixer()
-                        start_time = time() # Reset start_time after mixer is ready
+                        self.hold_thread_until_mixer(_MIXER_READY_TIMEOUT)
 
                     # Now update the screen, after the music has actually started
                     total_duration = song["duration"]
@@ -1227,42 +1907,52 @@ class MusicPlayer:
                     self.set_screen(song['artist'], self.get_display_title())
                     
                     # Ensure start_time reflects our position
-                    start_time = time() - start_pos
+                    start_time = monotonic() - start_pos
+                    self._set_song_anchor(start_time)
+                    self._last_published = None  # New song: the first tick publishes the clock
                     paused_duration = 0
                     last_save_time = 0
                     logged_song_play = False
-                    self.radio_master.initSong(
-                        title = fullTitle,
-                        mp3_song_file_path = song['path'],
-                        current_mixer = AudioPlayer,
-                        current_song_lyrics = str(self.current_song_lyrics)
-                    )
+                    # The radio host only needs re-announcing when the lyrics for this song arrive
+                    def announce_song():
+                        lyrics = self.current_song_lyrics  # Read once; the lyric thread may replace it meanwhile
+                        self.radio_master.initSong(
+                            title = fullTitle,
+                            mp3_song_file_path = song['path'],
+                            current_mixer = AudioPlayer,
+                            current_song_lyrics = lyrics,
+                            song_duration = total_duration
+                        )
+                        return lyrics
+                    announced_lyrics = announce_song()
                     
-                    while time() - start_time - paused_duration < total_duration:
-                        if self.skip_flag.is_set(): break
-                        if self.pause_event.is_set():
-                            self.radio_master.initSong(
-                                title = fullTitle,
-                                mp3_song_file_path = song['path'],
-                                current_mixer = AudioPlayer,
-                                current_song_lyrics = self.current_song_lyrics
-                            )
-                            pause_start = time()
+                    # Bound once per song; the tick below looks these up 4 times a second
+                    skip_is_set, pause_is_set = self.skip_flag.is_set, self.pause_event.is_set
+                    publish_tick, save_state = self._publish_tick, self.save_playback_state
+                    wait_track_end = AudioPlayer.track_ended.wait
+                    
+                    while True:
+                        # One clock read per tick; a pause doesn't move the position, so `elapsed` stays valid
+                        now = monotonic()
+                        elapsed = now - start_time - paused_duration
+                        if elapsed >= total_duration or skip_is_set(): break
+                        if pause_is_set():
+                            if self.current_song_lyrics is not announced_lyrics:
+                                announced_lyrics = announce_song()
+                            pause_start = now
+                            self._set_song_anchor(None)
                             AudioPlayer.pause()
                             self.save_playback_state()
-                            while self.pause_event.is_set():
-                                if self.skip_flag.is_set(): break
-                                sleep(0.25)
-                            paused_duration += time() - pause_start
+                            while self.pause_event.is_set() and not self.skip_flag.is_set():
+                                self.resume_event.wait(0.25)  # Wakes immediately on resume
+                            paused_duration += monotonic() - pause_start
                             AudioPlayer.unpause()
+                            self._set_song_anchor(start_time + paused_duration)
+                            self._last_published = None  # Redraw the clock as soon as playback resumes
 
                         if current_rotation_count % max_current_rotation == 0:
-                            self.radio_master.initSong(
-                                title = fullTitle,
-                                mp3_song_file_path = song['path'],
-                                current_mixer = AudioPlayer,
-                                current_song_lyrics = str(self.current_song_lyrics)
-                            )
+                            if self.current_song_lyrics is not announced_lyrics:
+                                announced_lyrics = announce_song()
                             if not logged_song_play and not is_first_run and self.song_elapsed_seconds >= abs(total_duration // 2): # If Past Halfway Log song play
                                 logged_artist_name = song['artist']
                                 if logged_artist_name.lower().__contains__("unknown"):
@@ -1274,13 +1964,13 @@ class MusicPlayer:
                                 logged_song_play = True
                             
                         current_rotation_count += 0.5 # Add One Else Loop Back
-                        self.song_elapsed_seconds = time() - start_time - paused_duration
-                        self.set_duration(self.song_elapsed_seconds, total_duration)
-                        self.set_screen(song['artist'], self.get_display_title())
-                        if time() - last_save_time > 1:
-                            self.save_playback_state()
-                            last_save_time = time()
-                        sleep(0.25)
+                        self.song_elapsed_seconds = elapsed
+                        publish_tick(song, elapsed, total_duration)
+                        if now - last_save_time > 1:
+                            save_state()
+                            last_save_time = now
+                        if wait_track_end(0.25):  # Tick, but wake at once when the file finishes
+                            break
 
                 except Exception as e:
                     self.set_screen("Error", song['title'])
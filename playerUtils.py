@@ -174,9 +174,17 @@ class MusicOverlayController:
                 f.write("")
             return []
         
-    def get_auto_directories(self, candidate_urls=[]):
+    def get_auto_directories(self, candidate_urls=None):
         """Automatically detects existing GTAV Enhanced User Music directories"""
-        valid_dirs = candidate_urls
+        valid_dirs = []
+        seen = set()  # normcase'd entries already listed, so a folder given twice is only scanned once
+        def add(entry):
+            key = os.path.normcase(entry)
+            if key not in seen:
+                seen.add(key)
+                valid_dirs.append(entry)
+        for url in candidate_urls or []:
+            add(url)
         
         # Determine base path based on OS
         if platform.system() == 'Windows':
@@ -192,10 +200,10 @@ class MusicOverlayController:
             Path.home() / "Games" / "GTAV Enhanced" / "User Music"
         ]
         
-        # Check which directories actually exist
+        # Check which directories actually exist (is_dir is a single stat, False when missing)
         for path in candidate_paths:
-            if path.exists() and path.is_dir():
-                valid_dirs.append(str(path.resolve()))
+            if path.is_dir():
+                add(str(path.resolve()))
 
         forcedPaths = [
             os.path.expanduser("~/MusicPlayerYoutubeDownloads"),
@@ -204,8 +212,9 @@ class MusicOverlayController:
         # Ensure forced paths exist
         for path in forcedPaths:
             os.makedirs(path, exist_ok=True)
+            add(path)
 
-        return [*valid_dirs, *forcedPaths]
+        return valid_dirs
 
     def _update_text(self, artist: str = '', title: str = ''):
         text = self.cleaner.clean(f"{artist} - {title}" if artist != "Unknown Artist" and not artist in title else title)
@@ -270,10 +279,13 @@ class ProgramShutdown:
             exit_code: Exit code for the program (0 = normal, non-zero = error)
             reason: Optional reason for shutdown (for logging)
         """
-        print(f"🔴 Initiating shutdown: {reason}" if reason else "🔴 Initiating shutdown")
+        with self._lock:
+            if self.shutdown_event.is_set():
+                return # Teardown already in progress
+            # Set shutdown event for any threads monitoring it
+            self.shutdown_event.set()
         
-        # Set shutdown event for any threads monitoring it
-        self.shutdown_event.set()
+        print(f"🔴 Initiating shutdown: {reason}" if reason else "🔴 Initiating shutdown")
         
         # Run cleanup callbacks
         for callback in self.cleanup_callbacks:
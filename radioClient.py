@@ -1,5 +1,5 @@
 import requests, re, os
-from threading import Thread, Event, Timer, Lock
+from threading import Thread, Event, Timer, Lock, Condition
 import numpy as np
 from mutagen.mp3 import MP3
 from time import time, sleep, monotonic
@@ -87,12 +87,29 @@ class TimeSync:
     
 class RadioClient:
     def __init__(self, audio_player, ip: str = ""):
-        self.client_data = {'radio_text': '', 'radio_text_clean': '', 'radio_duration': [0, 0]} # [current position, total song duration]
+        self.AudioPlayer = audio_player
         self._running = Event()
+        self.position_changed = Condition()  # Notified after each position / title update and on stop, so waiters need no polling
+        self.update_interval = 0.5
+        self.sync_threshold = 1.0 # Threshold for re-syncing client position to server position
+        self.temp_song_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache.mp3")
+
+        # Sync tuning (kept across reset() so a calibrated latency survives station switches)
+        self.BUFFER_DELAY = 2.0  # Seconds to buffer before starting playback
+        self.SYNC_INTERVAL = 2.0  # How often to resync clocks (seconds)
+        self.DRIFT_TOLERANCE = 0.05  # Max drift before correction (seconds)
+        self.latest_drift_time = 0.5 # The latest time for drifting in seconds
+        self.AUDIO_LATENCY_COMPENSATION = 0.25  # Start with observed drift
+        self.SYSTEM_LATENCY_COMPENSATION = 0.0   # Additional system delays
+
+        self._reset_station_state(ip)
+
+    def _reset_station_state(self, ip: str):
+        """Reset everything tied to the current host: display data, host EQ bookkeeping and song timing."""
+        self.client_data = {'radio_text': '', 'radio_text_clean': '', 'radio_duration': [0, 0]} # [current position, total song duration]
         self._paused = False
         self._repeat = False
         self._channel_changed = False
-        self.AudioPlayer = audio_player
         self._ip = ip
         self._callback = None
         self._handled = False
@@ -100,9 +117,6 @@ class RadioClient:
         self._original_eq_state = None  # Will store original EQ when we start accepting
         self._original_volume = None  # Will store original volume
         self._has_stored_original = False  # Track if we've saved the original state
-        self.update_interval = 0.5
-        self.sync_threshold = 1.0 # Threshold for re-syncing client position to server position
-        self.temp_song_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache.mp3")
         
         self.time_since_last_switch = 0.0
 
@@ -114,18 +128,22 @@ class RadioClient:
         
         # Add TimeSync instance
         self.time_sync = TimeSync()
-        self.BUFFER_DELAY = 2.0  # Seconds to buffer before starting playback
-        self.SYNC_INTERVAL = 2.0  # How often to resync clocks (seconds)
-        self.DRIFT_TOLERANCE = 0.05  # Max drift before correction (seconds)
-        self.latest_drift_time = 0.5 # The latest time for drifting in seconds
-        self.AUDIO_LATENCY_COMPENSATION = 0.25  # Start with observed drift
-        self.SYSTEM_LATENCY_COMPENSATION = 0.0   # Additional system delays
         self._song_sync_start_time = None 
         
         # FIXED: Add timing synchronization variables
         self._download_start_time = None  # When we started downloading
         self._server_time_at_download = None  # Server's buffered_at when we started downloading
 
+    def reset(self, ip: str = ""):
+        """
+        Stop listening and point this client at a new host without rebuilding it.
+        The running flag is replaced so update loops, downloads and timers from the previous host
+        (each holding the flag of the session that started it) see it cleared and exit.
+        """
+        self.stopListening()
+        self._running = Event()
+        self._reset_station_state(ip)
+
     def get_client_data(self):
         return self.client_data
 
@@ -199,6 +217,8 @@ class RadioClient:
         
         # Clear the running flag to stop the update loop
         self._running.clear()
+        with self.position_changed:
+            self.position_changed.notify_all()  # Release lyric waits so they can see the stop
         ll.debug("Stopped listening and restored local EQ")
 
     def _update_radio_title(self, title: str, duration: float = 0.0):
@@ -208,6 +228,8 @@ class RadioClient:
         self.client_data['radio_text_clean'] = title
         self.client_data['radio_text'] = f"{title} {'*=*' if self._paused else ''} {"*+*" if self._repeat else ""}"
         self.client_data['radio_duration'][1] = duration
+        with self.position_changed:
+            self.position_changed.notify_all()
         
     def _apply_host_eq(self, eq_data, volume):
         """
@@ -341,8 +363,9 @@ class RadioClient:
     def _update_loop(self):
         first_run = True
         last_sync_check = 0
+        running = self._running  # Bound once; reset() swaps in a fresh flag for the next host
         
-        while self._running.is_set():
+        while running.is_set():
             try:
                 # Periodic time synchronization
                 current_time = time()
@@ -394,7 +417,7 @@ class RadioClient:
                         sleep(1)
                     self.time_since_last_switch = time()
                     self._reset_song_timing()
-                    self._handle_song_change_synced(data)
+                    self._handle_song_change_synced(data, running)
 
                 # Update display info
                 self._update_radio_title(data['title'], data['duration'])
@@ -420,8 +443,8 @@ class RadioClient:
         self._current_song_start_time = None
         self._current_song_start_server_pos = 0.0
 
-    def _handle_song_change_synced(self, data):
-        """Handle song changes with precise timing synchronization"""
+    def _handle_song_change_synced(self, data, running):
+        """Handle song changes with precise timing synchronization; running is the session's flag."""
         ll.debug(f"🎵 New song: {data['title']} at server position: {data['location']:.2f}s")
         
         # Update client data immediately
@@ -432,13 +455,17 @@ class RadioClient:
         
         # Start download with timing info
         Thread(target=self._download_and_play_synced, 
-            args=(data['url'], data['location'], data_received_time), 
+            args=(data['url'], data['location'], data_received_time, running), 
             daemon=True).start()
 
-    def _download_and_play_synced(self, url, server_location, data_received_time):
-        """Download and play with precise timing synchronization"""
+    def _download_and_play_synced(self, url, server_location, data_received_time, running):
+        """
+        Download and play with precise timing synchronization.
+        Checks the flag of the session that started it, not self._running, so a reset() to a new host
+        cannot revive a download for the old one.
+        """
         try:
-            if not self._running.is_set():
+            if not running.is_set():
                 return
 
             # Stop current playback
@@ -466,9 +493,11 @@ class RadioClient:
 
             with open(self.temp_song_file, 'wb') as f:
                 for chunk in response.iter_content(chunk_size=8192):
-                    if not self._running.is_set():
+                    if not running.is_set():
                         return
                     f.write(chunk)
+            if not running.is_set():
+                return
             
             # Calculate timing correction
             download_end = self.time_sync.get_synced_time()
@@ -528,6 +557,8 @@ class RadioClient:
         else:
             # Fallback to server position
             self.client_data['radio_duration'][0] = server_pos
+        with self.position_changed:
+            self.position_changed.notify_all()
 
     def calibrate_audio_latency(self):
         """
@@ -623,7 +654,7 @@ class RadioClient:
             ll.error(f"Error fetching data: {e}")
             return None
 
-    def _handle_song_change(self, data):
+    def _handle_song_change(self, data, running):
         # Download immediately but don't play yet
         self._pre_download_song(data['url'])
         
@@ -634,16 +665,15 @@ class RadioClient:
         if current_time < target_start_time:
             # We have time to buffer
             delay = target_start_time - current_time
-            Timer(delay, self._start_synchronized_playback, 
-                args=[data['location']]).start()
+            Timer(delay, lambda: running.is_set() and self._start_synchronized_playback(data['location'])).start()
         else:
             # We're late, start immediately with position correction
             corrected_pos = data['location'] + (current_time - target_start_time)
             self._start_synchronized_playback(corrected_pos)
 
-    def _download_and_play(self, url, server_location, buffered_at):
+    def _download_and_play(self, url, server_location, buffered_at, running):
         try:
-            if not self._running.is_set():
+            if not running.is_set():
                 ll.warn("Download cancelled: client stopped.")
                 return
 
@@ -666,10 +696,12 @@ class RadioClient:
 
             with open(self.temp_song_file, 'wb') as f:
                 for chunk in response.iter_content(chunk_size=8192):
-                    if not self._running.is_set(): # Allow stopping during download
+                    if not running.is_set(): # Allow stopping during download
                         ll.warn("Download interrupted: client stopped.")
                         return
                     f.write(chunk)
+            if not running.is_set():
+                return
             ll.debug(f"Download complete: {self.temp_song_file}")
 
             # Calculate how much time has elapsed since we got the server data
@@ -706,7 +738,8 @@ class RadioClient:
                     ll.warn(f"Warning: Could not get song length for lyrics callback: {e}")
         except Exception as e:
             ll.error(f"Error in _download_and_play: {e}")
-            self.stopListening() # Stop if download/play fails
+            if running is self._running:
+                self.stopListening() # Stop if download/play fails (unless a newer session has taken over)
 
     # New method to handle resync, similar to _download_and_play but ensures current temp file is used
     def _resync_playback(self, url, new_server_location, buffered_at):
@@ -207,7 +207,10 @@ class RadioHost:
 
         @self.app.route('/lyrics')
         def serve_lyrics():
-            return self.current_data['lyrics'] or "[]"
+            lyrics = self.current_data['lyrics']
+            if isinstance(lyrics, str):
+                return lyrics or "[]"  # Already serialised (or nothing loaded yet)
+            return jsonify(lyrics)  # [(seconds, line), ...] -> JSON array of pairs
 
         @self.app.after_request
         def add_no_cache_headers(response):
@@ -246,8 +249,26 @@ class RadioHost:
             except Exception as e:
                 ll.error(f"Failed to start server on port {port}: {e}")
 
-    def initSong(self, title, mp3_song_file_path, current_mixer, current_song_lyrics=""):
-        """Call whenever you load a new track."""
+    def initSong(self, title, mp3_song_file_path, current_mixer, current_song_lyrics="", song_duration=None):
+        """
+        Call whenever you load a new track.
+        Pass song_duration when it is already known; otherwise the file header is read once per track.
+        """
+        if song_duration is None and mp3_song_file_path and mp3_song_file_path == self.current_data['mp3_path']:
+            song_duration = self.current_data['duration']  # Same track re-announced (pause / periodic refresh)
+        if song_duration is None:
+            song_duration = self._read_duration(mp3_song_file_path)
+
+        # Update data
+        self.current_data.update({
+            'title': title,
+            'mp3_path': mp3_song_file_path,
+            'lyrics': current_song_lyrics,
+            'mixer': current_mixer,
+            'duration': song_duration, # Set the actual duration
+        })
+
+    def _read_duration(self, mp3_song_file_path):
         song_duration = 0.0
         if os.path.exists(mp3_song_file_path):
             try:
@@ -261,15 +282,7 @@ class RadioHost:
                     song_duration = audio.info.length
             except Exception as e:
                 ll.error(f"Error getting duration for {mp3_song_file_path}: {e}")
-
-        # Update data
-        self.current_data.update({
-            'title': title,
-            'mp3_path': mp3_song_file_path,
-            'lyrics': current_song_lyrics,
-            'mixer': current_mixer,
-            'duration': song_duration, # Set the actual duration
-        })
+        return song_duration
 
     def _get_local_ip(self):
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
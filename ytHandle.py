@@ -1,4 +1,4 @@
-import os, re, sys, subprocess, yt_dlp
+import os, re, sys, queue, subprocess, yt_dlp
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from mutagen.mp3 import MP3
@@ -34,15 +34,15 @@ class DownloadPopup:
     def __init__(self):
         pass
     
-    def popup_process(self, close_event, progress_value, current_song):
+    def popup_process(self, updates):
         """
         Display download progress popup.
         
         Args:
-            close_event: multiprocessing.Event to signal closing
-            progress_value: multiprocessing.Value (float) for progress 0.0-1.0
-            current_song: SharedString instance with current song name
+            updates: multiprocessing.Queue of (song_name, progress 0.0-1.0) tuples; a None field
+                     keeps the previous value and a bare None closes the popup
         """
+        state = {'song_name': "", 'progress': 0.0}
         root = tk.Tk()
         root.overrideredirect(True)
         root.attributes('-topmost', True)
@@ -87,15 +87,30 @@ class DownloadPopup:
         progress['maximum'] = 100
 
         def update_progress():
-            if close_event.is_set():
+            # Drain everything queued since the last tick; only the latest values are shown
+            closing = False
+            try:
+                while True:
+                    update = updates.get_nowait()
+                    if update is None:
+                        closing = True
+                        break
+                    song_name, fraction = update
+                    if song_name is not None:
+                        state['song_name'] = song_name
+                    if fraction is not None:
+                        state['progress'] = fraction
+            except queue.Empty:
+                pass
+            
+            if closing:
                 root.destroy()
             else:
                 # Get progress value
-                value = max(0, min(1, progress_value.value)) * 100
+                value = max(0, min(1, state['progress'])) * 100
                 progress['value'] = value
                 
-                # Get current song name from SharedString
-                song_name = current_song.get()
+                song_name = state['song_name']
                 
                 # Update label
                 if song_name: